@@ -47,6 +47,12 @@ class BacktestPriceFeed:
     async def close(self) -> None:
         return
 
+    def get_cached_price(self, mint: str, now: float | None = None) -> float | None:
+        return None
+
+    async def prefetch(self, mints: list[str], now: float | None = None) -> None:
+        return
+
     async def update(self, position, now: float | None = None) -> float:
         return self._prices.get(position.token.mint, position.last_price)
 
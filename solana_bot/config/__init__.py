@@ -55,6 +55,10 @@ class Settings:
     TELEGRAM_POLL_UPDATES: bool = _env_bool("TELEGRAM_POLL_UPDATES", True)
     TELEGRAM_POLL_INTERVAL_SEC: float = _env_float("TELEGRAM_POLL_INTERVAL_SEC", 3.0)
     TELEGRAM_ENABLE_FORCE_SELL: bool = _env_bool("TELEGRAM_ENABLE_FORCE_SELL", True)
+    TELEGRAM_ALERT_COOLDOWN_SEC: float = _env_float("TELEGRAM_ALERT_COOLDOWN_SEC", 300.0)  # Drop repeated alerts per mint
+    TELEGRAM_MIN_SEND_INTERVAL_SEC: float = _env_float("TELEGRAM_MIN_SEND_INTERVAL_SEC", 1.0)  # ~1 msg/s per chat flood limit
+    TELEGRAM_QUEUE_MAX_SIZE: int = _env_int("TELEGRAM_QUEUE_MAX_SIZE", 1000)
+    TELEGRAM_CLOSE_FLUSH_SEC: float = _env_float("TELEGRAM_CLOSE_FLUSH_SEC", 10.0)  # Max wait to deliver queued alerts on shutdown
     TELEGRAM_LINK_DEXSCREENER: str = _env_str(
         "TELEGRAM_LINK_DEXSCREENER", "https://dexscreener.com/solana/{pair_or_mint}"
     )
@@ -175,6 +179,13 @@ class Settings:
     REALTIME_JUPITER_POLL_SEC: float = _env_float("REALTIME_JUPITER_POLL_SEC", 3.0)
     REALTIME_STALE_THRESHOLD_SEC: float = _env_float("REALTIME_STALE_THRESHOLD_SEC", 2.0)
     REALTIME_RECONNECT_DELAY_SEC: float = _env_float("REALTIME_RECONNECT_DELAY_SEC", 60.0)
+    REALTIME_WAKE_MIN_SEC: float = _env_float("REALTIME_WAKE_MIN_SEC", 0.2)  # Floor between price-driven ticks
+    REALTIME_WAKE_GAP_SCALE: float = _env_float("REALTIME_WAKE_GAP_SCALE", 10.0)  # Wake floor (s) per unit gap to nearest stop
+    # Position price monitor: poll faster on volatile positions, slower on flat ones
+    PRICE_MONITOR_POLL_SEC: float = _env_float("PRICE_MONITOR_POLL_SEC", 2.0)
+    PRICE_MONITOR_MIN_POLL_SEC: float = _env_float("PRICE_MONITOR_MIN_POLL_SEC", 1.0)
+    PRICE_MONITOR_MAX_POLL_SEC: float = _env_float("PRICE_MONITOR_MAX_POLL_SEC", 6.0)  # Keep below the 10s price TTL
+    PRICE_MONITOR_TARGET_MOVE_PCT: float = _env_float("PRICE_MONITOR_TARGET_MOVE_PCT", 0.01)  # Expected move per poll
 
     # DexScreener
     USE_DEXSCREENER_DISCOVERY: bool = _env_bool("USE_DEXSCREENER_DISCOVERY", True)
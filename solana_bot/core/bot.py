@@ -1,19 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import json
 import os
+import time
 from pathlib import Path
 
 from solana_bot.config import Settings
-from solana_bot.core.bounce_recovery import BounceRecoveryManager
+from solana_bot.core.bounce_recovery import BounceRecoveryManager, BounceSignal
 from solana_bot.core.convex_state_machine import ConvexStateMachine
 from solana_bot.core.dev_tracker import DevTracker
+from solana_bot.core.dexscreener_client import best_pair_by_liquidity
 from solana_bot.core.dynamic_eas_tracker import EASTracker
 from solana_bot.core.dynamic_trailing import TrailingCalculator
 from solana_bot.core.entry_scorer import EntryScorer
-from solana_bot.core.entry_scorer import EntryScorer
 from solana_bot.core.event_bus import EventBus
 from solana_bot.core.insightx_client import InsightXClient
 from solana_bot.core.lp_monitor import LPMonitor
@@ -40,8 +42,21 @@ from solana_bot.core.trade_metrics_logger import TradeMetricsLogger, get_metrics
 from solana_bot.core.trader import Trader
 from solana_bot.core.validator import Validator
 from solana_bot.core.wallet_tracker import WalletTracker, CopySignal
+from solana_bot.utils import fast_json
 from solana_bot.utils.time import utc_ts
 
+try:
+    import supabase_sync
+except Exception:  # pragma: no cover - optional dependency
+    supabase_sync = None
+
+BUY_EVENTS = frozenset(
+    {"ENTRY_SCOUT", "ENTRY_COPY", "ADD_CONFIRM", "ADD_CONVICTION", "ADD_COPY", "BOUNCE_REENTRY"}
+)
+
+# PnL moves smaller than this (0.01 percentage points) reuse the cached risk evaluation
+RISK_PNL_EPSILON = 1e-4
+
 
 class Bot:
     def __init__(
@@ -58,14 +73,25 @@ class Bot:
         self.logger = logging.getLogger("solana_bot.bot")
 
         self.scanner = scanner or TokenScanner(settings)
+        # Optional scanner hooks, resolved once instead of per tick / transition
+        self._ensure_holder = self._scanner_hook("ensure_holder_stats")
+        self._refresh_metrics = self._scanner_hook("refresh_token_metrics")
+        self._refresh_many_metrics = self._scanner_hook("refresh_tokens_metrics")
         self.validator = Validator(settings)
         self.rugchecker = Rugchecker(settings)
         self.entry_scorer = EntryScorer(settings)
-        self.price_feed = price_feed or PriceFeed(settings, dexscreener=self.scanner.dex_client)
+        # Share the scanner's HTTP clients so both reuse the same keep-alive connection pools
+        self.price_feed = price_feed or PriceFeed(
+            settings,
+            coingecko=getattr(self.scanner, "coingecko", None),
+            dexscreener=self.scanner.dex_client,
+        )
         self.trader = trader or Trader(settings)
         self.event_bus = event_bus or EventBus()
         self.state_machine = ConvexStateMachine(settings)
         self.eas_tracker = EASTracker()
+        # mint -> (signals, pnl_pct, trailing stop multiplier) once risk evaluation reached a fixed point
+        self._risk_inputs: dict[str, tuple[object, float, float]] = {}
         self.trailing_calc = TrailingCalculator(settings)
         self.partial_exit_manager = PartialExitManager(settings)
         self.runner_protection = RunnerProtection()
@@ -73,20 +99,11 @@ class Bot:
         self.dev_tracker = DevTracker(settings)
         self.lp_monitor = LPMonitor(settings)
         self.metrics_logger = metrics_logger or get_metrics_logger(settings)
-        self.metrics_logger = metrics_logger or get_metrics_logger(settings)
         self.supervisor = supervisor
         self.position_monitor = PositionMonitor(settings)
         self.insightx_client = InsightXClient(settings.INSIGHTX_API_KEY) if settings.INSIGHTX_API_KEY else None
         self.telegram = TelegramNotifier(settings) if settings.TELEGRAM_ENABLED else None
 
-        # Pattern analyzer for pump & dump detection
-        from solana_bot.core.pattern_analyzer import PatternAnalyzer
-        self.pattern_analyzer = PatternAnalyzer(settings)
-        
-        # Entry signal detector for optimal timing
-        from solana_bot.core.entry_signal_detector import EntrySignalDetector
-        self.entry_signal_detector = EntrySignalDetector(settings)
-        
         # Bounce recovery manager for re-entering after stop losses
         self.bounce_manager = BounceRecoveryManager(settings)
         
@@ -102,12 +119,6 @@ class Bot:
         # Dedicated position price monitor (aggressive polling)
         self.position_price_monitor = PositionPriceMonitor(settings, self.realtime_feed)
         
-        if settings.ENABLE_CRIMINOLOGY:
-            from solana_bot.core.criminology import DevDetective
-            self.dev_detective = DevDetective(settings)
-        else:
-            self.dev_detective = None
-        
         # Copy Trading
         self.wallet_tracker: WalletTracker | None = None
         self.wallet_webhook = None
@@ -117,6 +128,14 @@ class Bot:
             self.wallet_webhook = HeliusWalletWebhook(settings, self.wallet_tracker)
 
         self.positions: dict[str, Position] = {}
+        # Immutable (mint, position) snapshot for the per-tick loop; rebuilt only after
+        # a position is indexed or released (see _position_items)
+        self._positions_snapshot: tuple[tuple[str, Position], ...] | None = None
+        # Open SCOUT positions, for the MAX_CONCURRENT_SCOUTS gate
+        self._scout_mints: set[str] = set()
+        # Copy-trade index: open copy mint -> its leader key, and leader key -> mints (see _leader_key)
+        self._copy_mints: dict[str, str | None] = {}
+        self._leader_positions: dict[str, set[str]] = {}
         self.stats = BotStats(cash_sol=settings.SIM_STARTING_BALANCE_SOL)
         self._running = True
         self.paused = False
@@ -129,12 +148,47 @@ class Bot:
         self._sol_price_usd: float = 0.0
         self._cached_sol_price: float = 0.0
         self._sol_price_last_update: float = 0.0
-        self._last_balance_check: float = 0.0
-        self._last_position_sync: float = 0.0  # NEW: Track last position sync
+        # Live-only interval gates, in time.monotonic() units so wall-clock jumps cannot skip or repeat them
+        self._last_balance_check: float = float("-inf")
+        self._last_position_sync: float = float("-inf")  # NEW: Track last position sync
+        self._stop_gap: float = 0.0  # Closest position-to-stop distance seen on the last tick
         
         # Token blacklist (avoid buying specific tokens)
         self._blacklist: set[str] = set()
         self._blacklist_file = Path("logs/blacklist.json")
+        self._blacklist_mtime: float | None = None
+        self._last_blacklist_check = 0.0
+
+        # Live position rows for Supabase, upserted in batches by a background worker
+        self._supabase_queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=1000)
+        self._supabase_worker: asyncio.Task | None = None
+
+        # Snapshot writes are debounced onto a background task, off the sell path
+        self._snapshot_dirty = asyncio.Event()
+        self._snapshot_flusher: asyncio.Task | None = None
+
+    # Entry-time analyzers are only needed once a candidate reaches the entry checks:
+    # import and build them on first use instead of at construction
+
+    @functools.cached_property
+    def pattern_analyzer(self):
+        """Pattern analyzer for pump & dump detection."""
+        from solana_bot.core.pattern_analyzer import PatternAnalyzer
+        return PatternAnalyzer(self.settings)
+
+    @functools.cached_property
+    def entry_signal_detector(self):
+        """Entry signal detector for optimal timing."""
+        from solana_bot.core.entry_signal_detector import EntrySignalDetector
+        return EntrySignalDetector(self.settings)
+
+    @functools.cached_property
+    def dev_detective(self):
+        """Creator history checks, or None when ENABLE_CRIMINOLOGY is off."""
+        if not self.settings.ENABLE_CRIMINOLOGY:
+            return None
+        from solana_bot.core.criminology import DevDetective
+        return DevDetective(self.settings)
 
     async def run(self) -> None:
         await self.initialize()
@@ -146,25 +200,52 @@ class Bot:
             root_logger.addHandler(SupabaseLogHandler())
             self.logger.info("✅ Remote logging to Supabase enabled")
         except Exception as e:
-            self.logger.warning(f"Failed to enable remote logging: {e}")
+            self.logger.warning("Failed to enable remote logging: %s", e)
             
         self.logger.info("Bot starting - STABILITY FIX APPLIED (Watchdog & SafetyNet Active)")
         tick = 0
+        error_streak = 0
+        next_full_tick = 0.0  # time.monotonic() deadline of the next full step()
         while self._running:
+            # Pushed prices can wake the loop between full ticks; those early wakes
+            # only re-check prices and stops, everything else stays on SIM_TICK_SEC
+            full_tick = time.monotonic() >= next_full_tick
             try:
-                await self.step(utc_ts())
+                if full_tick:
+                    next_full_tick = time.monotonic() + self.settings.SIM_TICK_SEC
+                    await self.step(utc_ts())
+                else:
+                    await self._price_step(utc_ts())
+                error_streak = 0
             except Exception as e:
                 self.logger.error("CRITICAL ERROR in bot loop: %s", e, exc_info=True)
-                await asyncio.sleep(5.0)  # Cool down on error
+                # Cool down on error, backing off (5s, 10s, 20s ... 60s) while failures persist
+                await asyncio.sleep(min(60.0, 5.0 * 2 ** min(error_streak, 4)))
+                error_streak += 1
                 
-            tick += 1
-            if self.settings.SIM_MAX_TICKS and tick >= self.settings.SIM_MAX_TICKS:
-                break
-            await asyncio.sleep(self.settings.SIM_TICK_SEC)
+            if full_tick:
+                tick += 1
+                if self.settings.SIM_MAX_TICKS and tick >= self.settings.SIM_MAX_TICKS:
+                    break
+            await self._wait_next_tick(next_full_tick - time.monotonic())
 
         await self.shutdown()
         self.logger.info("Bot stopped")
 
+    async def _wait_next_tick(self, remaining: float) -> None:
+        """Sleep until the next full tick (`remaining` seconds away), waking early when
+        an open position gets a pushed price."""
+        remaining = max(0.0, remaining)
+        if not self.positions:
+            await asyncio.sleep(remaining)
+            return
+        # Far from every stop, let pushed prices batch up for longer; near a stop,
+        # wake on each push after REALTIME_WAKE_MIN_SEC
+        min_sec = max(self.settings.REALTIME_WAKE_MIN_SEC, self._stop_gap * self.settings.REALTIME_WAKE_GAP_SCALE)
+        min_sec = min(min_sec, remaining)
+        await asyncio.sleep(min_sec)
+        await self.realtime_feed.wait_for_update(remaining - min_sec)
+
     async def initialize(self) -> None:
         start = getattr(self.scanner, "start", None)
         if callable(start):
@@ -197,6 +278,7 @@ class Bot:
                 self.logger.info("Restored %d positions from snapshot", len(restored))
                 # Subscribe to real-time prices for restored positions
                 for position in restored.values():
+                    self._index_position(position)
                     await self.realtime_feed.subscribe(position.token)
                     self.position_price_monitor.add_position(position)
         
@@ -222,16 +304,7 @@ class Bot:
                 self.logger.error("Failed to fetch wallet balance: %s", e)
         
         # Load token blacklist
-        try:
-            if self._blacklist_file.exists():
-                with open(self._blacklist_file, 'r') as f:
-                    blacklist_data = json.load(f)
-                    self._blacklist = set(blacklist_data)
-                    self.logger.info("🚫 Loaded %d blacklisted tokens", len(self._blacklist))
-        except Exception as e:
-            self.logger.warning("Failed to load blacklist: %s", e)
-        
-        self.logger.info("Real-time price feed initialized")
+        self._reload_blacklist(utc_ts(), force=True)
         
         self.logger.info("Real-time price feed initialized")
 
@@ -244,15 +317,28 @@ class Bot:
         close_feed = getattr(self.price_feed, "close", None)
         if callable(close_feed):
             await close_feed()
-        # Stop real-time price feed
-        await self.realtime_feed.stop()
-        # Stop dedicated position monitor
-        await self.position_price_monitor.stop()
+        # Stop real-time price feed and dedicated position monitor together
+        await asyncio.gather(
+            self.realtime_feed.stop(),
+            self.position_price_monitor.stop(),
+        )
         # Stop copy trading webhook
         if self.wallet_webhook:
             await self.wallet_webhook.stop()
         if self.telegram:
             await self.telegram.close()
+        if self.insightx_client:
+            await self.insightx_client.close()
+        if self._snapshot_flusher:
+            self._snapshot_flusher.cancel()
+            self._snapshot_flusher = None
+        if self._snapshot_dirty.is_set():
+            self._snapshot_dirty.clear()
+            await self._write_positions_snapshot()
+        # After the final snapshot, which may have queued rows and restarted the worker
+        if self._supabase_worker:
+            self._supabase_worker.cancel()
+            self._supabase_worker = None
 
     async def step(self, now: float) -> None:
         # Handle bot control commands first
@@ -263,16 +349,41 @@ class Bot:
             await asyncio.sleep(1.0)  # Reduced sleep when paused
             return
         
-        await self._update_sol_price()  # Keep SOL price cached for Telegram
-        await self._maybe_update_balance(now) # Keep balance updated
-        await self._sync_positions_with_balances(now)  # NEW: Sync positions with on-chain balances
+        # Independent read phase: SOL price cache (for Telegram), wallet balance and the
+        # on-chain position sync touch disjoint state, so let their round-trips overlap.
+        # Their intervals are checked here first so quiet ticks create no coroutines or tasks
+        mono = time.monotonic()
+        refreshes = []
+        if utc_ts() - self._sol_price_last_update >= 300:
+            refreshes.append(self._update_sol_price())
+        if not self.settings.PAPER_TRADING_MODE:
+            if mono - self._last_balance_check >= 60.0:
+                refreshes.append(self._maybe_update_balance(mono))
+            if mono - self._last_position_sync >= 60.0:
+                refreshes.append(self._sync_positions_with_balances(mono))
+        if refreshes:
+            results = await asyncio.gather(*refreshes, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error("Tick refresh failed: %s", result)
         await self._maybe_scan(now)
         await self._process_copy_signals(now)
         await self._update_positions(now)
-        self.position_monitor.maybe_log(self.positions, now, self.stats)
+        if self.position_monitor.is_due(now):
+            self._save_positions()
         await self._check_dashboard_signals()
         self._apply_supervisor()
 
+    async def _price_step(self, now: float) -> None:
+        """Price-driven wake between full ticks: prices, peaks and stops only.
+
+        The state machine's consecutive-window counters, scans, monitors and
+        dashboard polling count full ticks, so they must not run here.
+        """
+        if not self.bot_active:
+            return
+        await self._update_positions(now, full_tick=False)
+
     async def _maybe_update_balance(self, now: float) -> None:
         """Periodically update wallet balance in live mode."""
         if self.settings.PAPER_TRADING_MODE:
@@ -304,7 +415,7 @@ class Bot:
                         balance, min_balance_threshold
                     )
                     if self.telegram:
-                        await self.telegram.send_message(
+                        self.telegram.queue_message(
                             f"🛑 **EMERGENCY STOP**\n\n"
                             f"Balance: {balance:.4f} SOL\n"
                             f"Minimum: {min_balance_threshold:.2f} SOL\n\n"
@@ -326,15 +437,31 @@ class Bot:
         self._last_position_sync = now
         
         # Check only copy trade positions (where manual sells are most likely)
+        copy_mints = tuple(self._copy_mints)
+        if not copy_mints:
+            return
+
+        # One batched RPC for all balances; per-mint lookups only if the batch fails
+        balances: dict[str, int] | None = None
+        try:
+            balances = await self.trader.get_token_balances(copy_mints)
+        except Exception as e:
+            self.logger.debug("Batched balance check failed, falling back to per-mint: %s", e)
+
         removed_positions = []
-        for mint, position in list(self.positions.items()):
-            is_copy = position.token.metadata.get("is_copy_trade", False)
-            if not is_copy:
+        for mint in copy_mints:
+            position = self.positions.get(mint)
+            if position is None:
                 continue
             
             try:
                 # Check on-chain balance
-                balance_raw = await self.trader.get_token_balance(mint)
+                if balances is not None:
+                    balance_raw = balances.get(mint)
+                    if balance_raw is None:
+                        continue
+                else:
+                    balance_raw = await self.trader.get_token_balance(mint)
                 if balance_raw == 0 and position.size_sol > 0:
                     self.logger.warning(
                         "📊 POSITION SYNC: %s has 0 balance (manual sell detected), removing position",
@@ -342,7 +469,7 @@ class Bot:
                     )
                     removed_positions.append(mint)
                     # Unsubscribe from price updates
-                    await self.realtime_feed.unsubscribe(position.token)
+                    await self.realtime_feed.unsubscribe(mint)
                     self.position_price_monitor.remove_position(mint)
             except Exception as e:
                 self.logger.debug("Balance check failed for %s: %s", mint[:8], e)
@@ -350,15 +477,18 @@ class Bot:
         # Remove positions
         for mint in removed_positions:
             self.positions.pop(mint, None)
-            self._save_positions()
+            self._release_trackers(mint)
             self.logger.info("✅ Position removed: %s", mint[:8])
+        if removed_positions:
+            self._save_positions()
 
     async def _maybe_scan(self, now: float) -> None:
         if self.paused:
             return
         if now < self.cooldown_until:
             return
-        if len(self.positions) >= self.settings.MAX_POSITIONS:
+        max_positions = self.settings.MAX_POSITIONS
+        if len(self.positions) >= max_positions:
             return
         if now - self._last_scan_ts < self.settings.SCAN_INTERVAL_SEC:
             return
@@ -366,7 +496,7 @@ class Bot:
 
         tokens = await self.scanner.scan()
         for token in tokens:
-            if len(self.positions) >= self.settings.MAX_POSITIONS:
+            if len(self.positions) >= max_positions:
                 break
             await self._try_open_scout(token, now)
 
@@ -377,17 +507,57 @@ class Bot:
         if self.paused:
             return
         
-        signals = await self.wallet_tracker.drain_signals()
+        signals = self.wallet_tracker.drain_signals()
         for signal in signals:
             await self._try_copy_trade(signal, now)
     
+    async def _race_copy_price(self, mint: str) -> tuple[float, dict | None, str]:
+        """Query PriceFeed and DexScreener concurrently and return the first positive price.
+
+        Returns (price, best DexScreener pair or None, source label); price is 0.0 if no source answers.
+        """
+        async def from_feed() -> tuple[float, dict | None]:
+            return (await self.price_feed.get_price_by_mint(mint) or 0.0), None
+
+        async def from_dex() -> tuple[float, dict | None]:
+            pairs = await self.scanner.dex_client.get_token_pairs(mint)
+            if not pairs:
+                return 0.0, None
+            best_pair = best_pair_by_liquidity(pairs)
+            return float(best_pair.get("priceUsd", 0) or best_pair.get("priceNative", 0)), best_pair
+
+        tasks = {
+            asyncio.create_task(from_feed()): "PumpPortal/Jupiter",
+            asyncio.create_task(from_dex()): "DexScreener",
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled():
+                        continue
+                    if task.exception() is not None:
+                        self.logger.debug("COPY price lookup via %s failed: %s", tasks[task], task.exception())
+                        continue
+                    price, pair = task.result()
+                    if price > 0:
+                        return price, pair, tasks[task]
+            return 0.0, None, ""
+        finally:
+            # Losers are no longer needed once a price is in hand
+            for task in pending:
+                task.cancel()
+
     async def _try_copy_trade(self, signal: CopySignal, now: float) -> None:
         """Execute a copy trade based on leader signal."""
         # Check blacklist FIRST (before any processing)
+        self._reload_blacklist(now)
         if signal.token_mint in self._blacklist:
             self.logger.warning("🚫 BLACKLIST: Skipping %s (blacklisted)", signal.token_symbol)
             return
-        max_age_sec = getattr(self.settings, "COPY_SIGNAL_MAX_AGE_SEC", 30.0)
+        settings = self.settings
+        max_age_sec = getattr(settings, "COPY_SIGNAL_MAX_AGE_SEC", 30.0)
         if signal.timestamp and max_age_sec > 0:
             age_sec = now - signal.timestamp
             if age_sec > max_age_sec:
@@ -412,7 +582,7 @@ class Bot:
         if signal.action == "SELL":
             position = self.positions.get(signal.token_mint)
             if position:
-                if not position.token.metadata.get("is_copy_trade", False):
+                if signal.token_mint not in self._copy_mints:
                     self.logger.debug("COPY SELL ignored for %s: existing position is not copy trade", signal.token_symbol)
                     return
                 if not leader_matches(position):
@@ -425,30 +595,12 @@ class Bot:
                 await self._exit_position(position, f"COPY_SELL_{signal.leader_alias}")
                 self.wallet_tracker.mark_signal_processed(signal, success=True)
             else:
-                # Try fallback lookup (strip whitespace)
-                found_mint = None
-                for key in self.positions.keys():
-                    if key.strip() == signal.token_mint.strip():
-                        found_mint = key
-                        break
-                
-                if found_mint:
-                    self.logger.warning("⚠️ Found position for %s using fuzzy match (key mismatch)", signal.token_symbol)
-                    position = self.positions[found_mint]
-                    if not position.token.metadata.get("is_copy_trade", False):
-                        self.logger.debug("COPY SELL ignored for %s: existing position is not copy trade", signal.token_symbol)
-                        return
-                    if not leader_matches(position):
-                        self.logger.debug("COPY SELL ignored for %s: leader mismatch", signal.token_symbol)
-                        return
-                    await self._exit_position(position, f"COPY_SELL_{signal.leader_alias}_FUZZY")
-                    self.wallet_tracker.mark_signal_processed(signal, success=True)
-                else:
-                    # Log available keys for debugging
-                    keys_snippet = list(self.positions.keys())
+                # Signal and position mints are both normalized at the source, so a miss is real
+                if self.logger.isEnabledFor(logging.WARNING):
                     self.logger.warning(
-                        "⚠️ COPY SELL IGNORED: %s sold %s (%s) but we have no position! Open positions: %s",
-                        signal.leader_alias, signal.token_symbol, signal.token_mint, keys_snippet
+                        "⚠️ COPY SELL IGNORED: %s sold %s (%s) but we have no position! Open positions (%d): %s",
+                        signal.leader_alias, signal.token_symbol, signal.token_mint,
+                        len(self.positions), list(self.positions)[:10],
                     )
         
         # Handle BUY signals
@@ -468,82 +620,56 @@ class Bot:
         if is_new_position and self.wallet_tracker:
             leader = self.wallet_tracker.get_leader(signal.leader_address)
             if leader and leader.max_positions > 0:
-                leader_open = 0
-                for pos in self.positions.values():
-                    if not pos.token.metadata.get("is_copy_trade", False):
-                        continue
-                    leader_addr = pos.token.metadata.get("copy_leader_address")
-                    leader_alias = pos.token.metadata.get("copy_leader")
-                    if (leader_addr and leader_addr == leader.address) or (
-                        not leader_addr and leader_alias == leader.alias
-                    ):
-                        leader_open += 1
+                leader_open = len(self._leader_positions.get(leader.address, ()))
+                if leader.alias:
+                    leader_open += len(self._leader_positions.get(f"alias:{leader.alias}", ()))
                 if leader_open >= leader.max_positions:
                     self.logger.debug("COPY_SKIP: Max positions reached for leader %s", leader.alias)
                     return
         
         # Check position limits for NEW positions
-        if is_new_position and len(self.positions) >= self.settings.COPY_MAX_POSITIONS:
+        if is_new_position and len(self.positions) >= settings.COPY_MAX_POSITIONS:
             self.logger.debug("COPY_SKIP: Max copy positions reached")
             return
         
 
         
         # Add delay if configured
-        if self.settings.COPY_DELAY_MS > 0:
-            await asyncio.sleep(self.settings.COPY_DELAY_MS / 1000.0)
+        copy_delay_ms = settings.COPY_DELAY_MS
+        if copy_delay_ms > 0:
+            await asyncio.sleep(copy_delay_ms / 1000.0)
         
         # Get token price
         price = 0.0
         best_pair = None
         
         # FAST MODE: Skip price lookups, use leader's price directly for speed
-        if self.settings.COPY_FAST_MODE and signal.price and signal.price > 0:
-            if getattr(signal, "price_in_usd", False):
+        if settings.COPY_FAST_MODE and signal.price and signal.price > 0:
+            if signal.price_in_usd:
                 price = signal.price
                 self.logger.info("COPY FAST MODE: Using leader USD price $%.9f", price)
             else:
-                sol_usd = self._cached_sol_price if hasattr(self, "_cached_sol_price") and self._cached_sol_price > 0 else 130.0
+                sol_usd = self._cached_sol_price if self._cached_sol_price > 0 else 130.0
                 price = signal.price * sol_usd
                 self.logger.info("COPY FAST MODE: Using leader SOL price $%.9f", price)
         else:
-            # Normal mode: try multiple price sources
-            for attempt in range(2):
-                # 1. Try RealTime FIRST
-                realtime_price = self.realtime_feed.get_latest_price(signal.token_mint)
-                if realtime_price and realtime_price > 0:
-                    price = realtime_price
-                    self.logger.info("COPY price from RealTime for %s: $%.9f", signal.token_symbol, price)
-                    break
-                
-                # 2. Try PumpPortal/Jupiter price feed
-                if price <= 0:
-                    fallback_price = await self.price_feed.get_price_by_mint(signal.token_mint)
-                    if fallback_price and fallback_price > 0:
-                        price = fallback_price
-                        self.logger.info("COPY price from PumpPortal/Jupiter for %s: $%.9f", signal.token_symbol, price)
-                        break
-                
-                # 3. Try DexScreener (slower)
-                if price <= 0:
-                    pairs = await self.scanner.dex_client.get_token_pairs(signal.token_mint)
-                    if pairs:
-                        best_pair = max(pairs, key=lambda p: (p.get("liquidity") or {}).get("usd", 0.0))
-                        price = float(best_pair.get("priceUsd", 0) or best_pair.get("priceNative", 0))
-                        if price > 0:
-                            self.logger.info("COPY price from DexScreener for %s: $%.9f", signal.token_symbol, price)
-                            break
-                
-                if attempt < 1:
-                    await asyncio.sleep(0.5)
+            # Normal mode: RealTime cache first, then race the network sources
+            realtime_price = self.realtime_feed.get_latest_price(signal.token_mint)
+            if realtime_price and realtime_price > 0:
+                price = realtime_price
+                self.logger.info("COPY price from RealTime for %s: $%.9f", signal.token_symbol, price)
+            else:
+                price, best_pair, source = await self._race_copy_price(signal.token_mint)
+                if price > 0:
+                    self.logger.info("COPY price from %s for %s: $%.9f", source, signal.token_symbol, price)
             
             # Final fallback to leader price
             if price <= 0 and signal.price and signal.price > 0:
-                if getattr(signal, "price_in_usd", False):
+                if signal.price_in_usd:
                     price = signal.price
                     self.logger.info("COPY price from leader USD for %s: $%.9f", signal.token_symbol, price)
                 else:
-                    sol_usd = self._cached_sol_price if hasattr(self, "_cached_sol_price") and self._cached_sol_price > 0 else 130.0
+                    sol_usd = self._cached_sol_price if self._cached_sol_price > 0 else 130.0
                     price = signal.price * sol_usd
                     self.logger.info("COPY price from leader SOL for %s: $%.9f", signal.token_symbol, price)
         
@@ -555,9 +681,9 @@ class Bot:
 
 
         # Check if we already have a position -> DCA / Add to position
-        if signal.token_mint in self.positions:
-            position = self.positions[signal.token_mint]
-            if not position.token.metadata.get("is_copy_trade", False):
+        position = self.positions.get(signal.token_mint)
+        if position is not None:
+            if signal.token_mint not in self._copy_mints:
                 self.logger.debug("COPY_SKIP %s: Existing position is not copy trade", signal.token_symbol)
                 return
             if not leader_matches(position):
@@ -586,7 +712,8 @@ class Bot:
             new_price = trade.price
             
             total_size = old_size + new_size
-            avg_price = ((old_size * old_entry) + (new_size * new_price)) / total_size
+            # Interpolate towards the fill price rather than summing two size*price products
+            avg_price = old_entry + (new_size / total_size) * (new_price - old_entry)
             
             position.size_sol = total_size
             position.initial_size_sol += new_size # Track total initial investment
@@ -594,7 +721,7 @@ class Bot:
             position.last_update = now
             position.bounce_reentry_count += 1 # Using this counter to track adds for now
             if trade.token_amount_raw > 0:
-                position.token_amount_raw = position.token_amount_raw + trade.token_amount_raw
+                position.token_amount_raw += trade.token_amount_raw
 
             
             self.logger.info(
@@ -698,6 +825,7 @@ class Bot:
             position.token.metadata["market_cap"] = signal.market_cap
         
         self.positions[signal.token_mint] = position
+        self._index_position(position)
         self.stats.daily_trades += 1
         
         # Subscribe to real-time price
@@ -716,38 +844,64 @@ class Bot:
         self._notify_telegram("SCOUT_OPEN", position)
         self.wallet_tracker.mark_signal_processed(signal, success=True)
 
+    def _reload_blacklist(self, now: float, force: bool = False) -> None:
+        """Reload logs/blacklist.json when its mtime changes (checked at most every 5s)."""
+        if not force and now - self._last_blacklist_check < 5.0:
+            return
+        self._last_blacklist_check = now
+        try:
+            mtime = self._blacklist_file.stat().st_mtime
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            self.logger.warning("Failed to stat blacklist: %s", e)
+            return
+        if mtime == self._blacklist_mtime:
+            return
+        try:
+            self._blacklist = set(fast_json.loads(self._blacklist_file.read_bytes()))
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning("Failed to load blacklist: %s", e)
+            return
+        self._blacklist_mtime = mtime
+        self.logger.info("🚫 Loaded %d blacklisted tokens", len(self._blacklist))
+
+    async def _investigate_creator(self, token: TokenInfo):
+        """DevDetective report for the token's creator, or None when disabled/unknown."""
+        if not self.dev_detective:
+            return None
+        creator = token.metadata.get("creator")
+        # If creator missing, try to fetch it (async)
+        if not creator and self.settings.PUMPFUN_ONLY:
+            creator = await self.dev_detective.get_token_creator(token.mint)
+        if not creator:
+            return None
+        return await self.dev_detective.investigate(creator)
+
+    def _scanner_hook(self, name: str):
+        """Bound scanner method `name`, or None when the scanner doesn't provide it."""
+        hook = getattr(self.scanner, name, None)
+        return hook if callable(hook) else None
+
     async def _try_open_scout(self, token: TokenInfo, now: float) -> None:
         # Check blacklist FIRST
+        self._reload_blacklist(now)
         if token.mint in self._blacklist:
             self.logger.debug("🚫 BLACKLIST: Skipping scout for %s", token.symbol)
             return
         
-        scout_count = sum(1 for pos in self.positions.values() if pos.state == PositionState.SCOUT)
-        if scout_count >= self.settings.MAX_CONCURRENT_SCOUTS:
+        if len(self._scout_mints) >= self.settings.MAX_CONCURRENT_SCOUTS:
             return
 
-        if not self.validator.validate(token):
+        # Can't afford the scout anyway - skip the RPC-heavy checks below
+        if self.stats.cash_sol < self.settings.CONVEX_SCOUT_SIZE_SOL:
             return
 
-        # Criminology Check (Dev Detective)
-        if self.dev_detective:
-            creator = token.metadata.get("creator")
-            # If creator missing, try to fetch it (async)
-            if not creator and self.settings.PUMPFUN_ONLY:
-                 creator = await self.dev_detective.get_token_creator(token.mint)
-            
-            if creator:
-                 report = await self.dev_detective.investigate(creator)
-                 if report and report.is_serial_rugger:
-                      self._log_event("DEV_REJECT", token, extra={"reason": str(report.details)})
-                      self.logger.info("🕵️ DevDetective REJECT %s: %s", token.symbol, report.details)
-                      return
-
-        rug = await self.rugchecker.check(token, token.phase, "SCOUT", current_pnl_pct=0.0)
-        if not rug.is_safe:
-            self._log_event("RUGCHECK_FAIL", token, extra={"risk": rug.risk_score, "flags": rug.flags})
+        if not self.validator.validate(token):
             return
 
+        # Pattern analysis and entry timing only read the scanned snapshot: run these
+        # cheap local checks before spending any network round-trips on the token
         # Pattern analysis - block pump & dump, distribution patterns
         pattern_safe, pattern_reason = self.pattern_analyzer.is_entry_safe(token)
         if not pattern_safe:
@@ -767,6 +921,22 @@ class Bot:
                 token.symbol, entry_signal.reason, entry_signal.score
             )
             return
+
+        # Dev history and RugCheck are independent lookups: run them concurrently
+        report, rug = await asyncio.gather(
+            self._investigate_creator(token),
+            self.rugchecker.check(token, token.phase, "SCOUT", current_pnl_pct=0.0),
+        )
+
+        # Criminology Check (Dev Detective)
+        if report and report.is_serial_rugger:
+            self._log_event("DEV_REJECT", token, extra={"reason": str(report.details)})
+            self.logger.info("🕵️ DevDetective REJECT %s: %s", token.symbol, report.details)
+            return
+
+        if not rug.is_safe:
+            self._log_event("RUGCHECK_FAIL", token, extra={"risk": rug.risk_score, "flags": rug.flags})
+            return
         
         self.logger.info(
             "ENTRY SIGNAL %s: %s [%s]",
@@ -774,12 +944,8 @@ class Bot:
         )
 
         # Ensure we have complete holder stats for dashboard display
-        ensure_holder = getattr(self.scanner, "ensure_holder_stats", None)
-        if callable(ensure_holder):
-            await ensure_holder(token)
-
-        if self.stats.cash_sol < self.settings.CONVEX_SCOUT_SIZE_SOL:
-            return
+        if self._ensure_holder:
+            await self._ensure_holder(token)
 
         trade = await self.trader.buy_async(token.mint, self.settings.CONVEX_SCOUT_SIZE_SOL, token.price, "SCOUT_ENTRY")
         if not trade.success:
@@ -803,15 +969,18 @@ class Bot:
         # Enrich with InsightX data if available
         if self.insightx_client:
             try:
-                # Run security check asynchronously without blocking flow critically
+                # Bounded wait: the position is not tracked until this returns
                 # Note: In a stricter setup, you might want to await this BEFORE buying
-                security = await self.insightx_client.get_token_security(token.mint)
+                security = await asyncio.wait_for(self.insightx_client.get_token_security(token.mint), timeout=2.0)
                 if security:
                     position.insightx_data = security
                     self.logger.info("InsightX Security for %s: Score %s/100", token.symbol, security.get('risk_score'))
+            except asyncio.TimeoutError:
+                self.logger.debug("InsightX timed out for %s, continuing without security data", token.symbol)
             except Exception as e:
                 self.logger.error("Failed to fetch InsightX data: %s", e)
         self.positions[token.mint] = position
+        self._index_position(position)
         self.stats.daily_trades += 1
         
         # Subscribe to real-time price updates
@@ -820,248 +989,310 @@ class Bot:
         self._log_trade("ENTRY_SCOUT", position, trade.price, trade.size_sol, trade.reason)
         self._notify_telegram("SCOUT_OPEN", position, rug=rug)
 
-    async def _update_positions(self, now: float) -> None:
-        for mint, position in list(self.positions.items()):
+    async def _update_positions(self, now: float, full_tick: bool = True) -> None:
+        """Reprice open positions and apply exits.
+
+        With full_tick=False (a price-driven wake, see _price_step) only prices,
+        peaks and stop-style exits are evaluated: no network refreshes, state
+        transitions, risk re-evaluation, monitors, partials or syncs.
+        """
+        # Settings are frozen - read the thresholds once per tick, not per position
+        settings = self.settings
+        dev_monitor_enabled = settings.ENABLE_DEV_MONITOR
+        lp_monitor_enabled = settings.ENABLE_LP_MONITOR
+        copy_emergency_stop = settings.COPY_EMERGENCY_STOP_LOSS_PCT
+        copy_trailing_trigger = settings.COPY_TRAILING_TRIGGER_PCT
+        copy_trailing_pct = settings.COPY_TRAILING_PCT
+        copy_trailing_keep = 1.0 - copy_trailing_pct
+        break_even_trigger = settings.BREAK_EVEN_TRIGGER_PCT
+        anti_panic_sec = settings.ANTI_PANIC_DURATION_SEC
+        scout_stop_pnl = -settings.SCOUT_STOP_LOSS_PCT
+        # Floor once break-even is armed: entry + fees (approx 1%), as a multiplier of entry
+        break_even_floor = 1.01
+        supabase_enabled = supabase_sync is not None and supabase_sync.is_enabled()
+        # Positions last pushed to Supabase before this are due again (~10s interval)
+        supabase_cutoff = now - 10
+
+        # Methods called for every position on every tick: resolve the bound methods once
+        monitor_position = self.position_price_monitor.add_position
+        score_signals = self.entry_scorer.score
+        should_exit = self.event_bus.should_exit
+        take_partials = self.partial_exit_manager.maybe_take_partials
+        compute_trailing = self.trailing_calc.compute
+        copy_mints = self._copy_mints  # Open copy trades, maintained on open/close
+
+        # Resolve each position's live price once per tick:
+        # Priority 1: dedicated position price monitor (aggressive 1.5s polling)
+        # Priority 2: real-time feed (PumpPortal WebSocket / Birdeye)
+        live_prices = self.position_price_monitor.get_prices(self.positions)
+        fallback_prices: dict[str, float] = {}
+        unpriced: list[str] = [mint for mint in self.positions if mint not in live_prices]
+        if unpriced:
+            live_prices.update(self.realtime_feed.get_latest_prices(unpriced))
+            unpriced = [mint for mint in unpriced if mint not in live_prices]
+
+        # Positions without a live price fall back to a DexScreener metrics refresh
+        # plus PriceFeed: run the refreshes and one batched quote concurrently
+        # instead of one round-trip after another
+        if unpriced and full_tick:
+            checks = [self.price_feed.prefetch(unpriced, now)]
+            if self._refresh_many_metrics:
+                checks.append(self._refresh_many_metrics([self.positions[mint].token for mint in unpriced], now))
+            elif self._refresh_metrics:
+                checks.extend(self._refresh_metrics(self.positions[mint].token, now) for mint in unpriced)
+            results = await asyncio.gather(*checks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.debug("Position price refresh failed: %s", result)
+
+            # Whatever the batched quote missed goes through PriceFeed's per-token
+            # fallbacks - fan those out too rather than awaiting them inside the loop
+            missing = [mint for mint in unpriced if self.price_feed.get_cached_price(mint, now) is None]
+            if missing:
+                results = await asyncio.gather(
+                    *(self.price_feed.update(self.positions[mint], now) for mint in missing),
+                    return_exceptions=True,
+                )
+                for mint, result in zip(missing, results):
+                    if isinstance(result, Exception):
+                        self.logger.debug("Position price fallback failed for %s: %s", mint[:8], result)
+                    else:
+                        fallback_prices[mint] = result
+
+        # Closest relative distance of any position to its stop, for _wait_next_tick
+        stop_gap = float("inf")
+
+        for mint, position in self._position_items():
             # Ensure position is being monitored aggressively
-            self.position_price_monitor.add_position(position)
+            monitor_position(position)
             
             position.last_update = now
+            token = position.token
             
-            # Priority 1: Dedicated position price monitor (aggressive 1.5s polling)
-            monitor_price = self.position_price_monitor.get_price(mint)
-            
-            # Priority 2: Real-time feed (PumpPortal WebSocket / Birdeye)
-            realtime_price = self.realtime_feed.get_latest_price(mint) if not monitor_price else None
-            
-            if monitor_price and monitor_price > 0:
-                # Use monitor price (most reliable, always polling)
-                new_price = monitor_price
+            live_price = live_prices.get(mint)
+            if live_price:
+                # Use monitor / real-time feed price
+                new_price = live_price
                 position.last_price = new_price
-                position.token.price = new_price
-            elif realtime_price and realtime_price > 0:
-                # Use real-time feed price
-                new_price = realtime_price
-                position.last_price = new_price
-                position.token.price = new_price
+                token.price = new_price
             else:
-                # Fallback to periodic DexScreener refresh
-                refresh = getattr(self.scanner, "refresh_token_metrics", None)
-                if callable(refresh):
-                    await refresh(position.token, now)
-                new_price = await self.price_feed.update(position, now)
+                # Metrics were refreshed above - fall back to PriceFeed
+                new_price = fallback_prices.get(mint)
+                if new_price is None:
+                    cached_price = self.price_feed.get_cached_price(mint, now)
+                    if cached_price is not None:
+                        new_price = cached_price
+                    elif full_tick:
+                        new_price = await self.price_feed.update(position, now)
+                    else:
+                        new_price = position.last_price  # No round-trips on a price-driven wake
                 position.last_price = new_price
             
-            position.peak_price = max(position.peak_price, new_price)
+            if new_price > position.peak_price:
+                position.peak_price = new_price
 
-            is_copy_trade = position.token.metadata.get("is_copy_trade", False)
-            pnl_pct = (new_price / position.entry_price) - 1.0
+            is_copy_trade = mint in copy_mints
+            # A restored snapshot row without an entry price must not abort the whole tick
+            entry_price = position.entry_price
+            pnl_pct = new_price / entry_price - 1.0 if entry_price > 0 else 0.0
+            age_sec = now - position.opened_at
 
             # --- SAFETY NET: Force exit for stuck SCOUT positions ---
             if position.state == PositionState.SCOUT and not is_copy_trade:
-                age_sec = now - position.opened_at
                 # Force exit if stuck > 15 mins (timeout is usually 3-5 mins)
-                if age_sec > 900: 
-                     self.logger.warning("🛡️ SAFETY NET: Forcing exit for stuck SCOUT %s (Age: %.0fs)", position.token.symbol, age_sec)
-                     await self._exit_position(position, "SCOUT_STUCK_TIMEOUT_SAFETY")
-                     continue
+                if age_sec > 900:
+                    await self._safety_exit(
+                        position, "SCOUT_STUCK_TIMEOUT_SAFETY",
+                        "🛡️ SAFETY NET: Forcing exit for stuck SCOUT %s (Age: %.0fs)", token.symbol, age_sec,
+                    )
+                    continue
                 # Hard stop safety net
                 if pnl_pct < -0.40:
-                     self.logger.warning("🛡️ SAFETY NET: Hard stop %s at %.1f%%", position.token.symbol, pnl_pct*100)
-                     await self._exit_position(position, "SCOUT_HARD_STOP_SAFETY")
-                     continue
+                    await self._safety_exit(
+                        position, "SCOUT_HARD_STOP_SAFETY",
+                        "🛡️ SAFETY NET: Hard stop %s at %.1f%%", token.symbol, pnl_pct * 100,
+                    )
+                    continue
             # ----------------------------------------------------
 
-            signals = self.entry_scorer.score(position.token)
+            if full_tick:
+                signals = score_signals(token)
             
             # Skip state machine for copy trades to avoid auto-scaling or timeout exits
             # We want to wait exclusively for the leader signal (or emergency SL)
-            if not is_copy_trade:
+            if full_tick and not is_copy_trade:
                 transition = self.state_machine.evaluate(position, signals, pnl_pct, now)
                 if transition:
-                    await self._handle_transition(position, transition.reason, transition.new_state)
+                    await self._handle_transition(position, transition.reason, transition.new_state, pnl_pct)
                     if transition.new_state == PositionState.EXIT:
                         continue
 
-            eas_value = self.eas_tracker.compute(signals, pnl_pct)
-            position.eas_value = eas_value
-            position.eas_risk_level = self.eas_tracker.update_risk_level(position.eas_risk_level, eas_value)
-            position.runner_state = self.runner_protection.get_state(pnl_pct)
-            position.narrative_phase = self.narrative_analyzer.analyze(position, signals, pnl_pct)
+            # EAS, runner state, narrative and the trailing stop are pure functions of
+            # (signals, pnl_pct) plus the risk-level hysteresis, so skip them while the
+            # signals are unchanged, PnL has not moved by more than RISK_PNL_EPSILON
+            # since the cached evaluation, and the risk level has settled
+            risk_inputs = self._risk_inputs.get(mint)
+            if not full_tick:
+                # Keep the last full tick's trailing distance; with no settled evaluation
+                # only the break-even floor and scout stop apply until the next full tick
+                trailing_keep = risk_inputs[2] if risk_inputs is not None else 0.0
+            elif (
+                risk_inputs is None
+                or risk_inputs[0] is not signals
+                or abs(risk_inputs[1] - pnl_pct) > RISK_PNL_EPSILON
+            ):
+                eas_value = self.eas_tracker.compute(signals, pnl_pct)
+                position.eas_value = eas_value
+                previous_risk = position.eas_risk_level
+                position.eas_risk_level = self.eas_tracker.update_risk_level(previous_risk, eas_value)
+                position.runner_state = self.runner_protection.get_state(pnl_pct)
+                position.narrative_phase = self.narrative_analyzer.analyze(position, signals, pnl_pct)
+                trailing_keep = 1.0 - compute_trailing(
+                    position.runner_state,
+                    position.eas_risk_level,
+                    position.narrative_phase,
+                    roi_pct=pnl_pct * 100.0,
+                )
+                if position.eas_risk_level == previous_risk:
+                    self._risk_inputs[mint] = (signals, pnl_pct, trailing_keep)
+                else:
+                    self._risk_inputs.pop(mint, None)
+            else:
+                trailing_keep = risk_inputs[2]
 
-            if self.settings.ENABLE_DEV_MONITOR:
+            if full_tick and dev_monitor_enabled:
                 dev_event = self.dev_tracker.check(position)
                 if dev_event:
                     self.event_bus.publish(mint, dev_event)
-            if self.settings.ENABLE_LP_MONITOR:
+            if full_tick and lp_monitor_enabled:
                 lp_event = self.lp_monitor.check(position)
                 if lp_event:
                     self.event_bus.publish(mint, lp_event)
 
-            if self.event_bus.should_exit(mint):
+            if should_exit(mint):
                 await self._exit_position(position, "EVENT_EXIT")
                 continue
 
 
             
             if is_copy_trade:
+                stop_gap = 0.0  # Copy exits follow the leader - always poll at full speed
                 # --- COPY TRADE SAFETY NET (ZOMBIE PROTECTION) ---
-                age_sec = now - position.opened_at
-                
-                # 1. Emergency Stop Loss: Configurable hard stop with 30s grace period
-                emergency_stop = self.settings.COPY_EMERGENCY_STOP_LOSS_PCT
-                if emergency_stop > 0 and pnl_pct <= -emergency_stop and age_sec > 30:
-                    self.logger.warning(
-                        "🛡️ COPY SAFETY NET: Hard stop for %s at %.1f%% (limit %.1f%%)",
-                        position.token.symbol, pnl_pct * 100, emergency_stop * 100
-                    )
-                    await self._exit_position(position, "COPY_HARD_STOP_SAFETY")
-                    continue
-
-                # 2. Zombie Timeout: If > 48 hours old and losing, force exit
-                age_hours = (now - position.opened_at) / 3600
-                if age_hours > 48 and pnl_pct < -0.10:
-                    self.logger.warning(
-                        "🛡️ COPY SAFETY NET: Timeout for %s (Age: %.1fh, PnL: %.1f%%)",
-                        position.token.symbol, age_hours, pnl_pct * 100
-                    )
-                    await self._exit_position(position, "COPY_TIMEOUT_SAFETY")
-                    continue
-
-                # 3. Never-Positive Timeout: If > 10 minutes and NEVER went positive, force exit
-                age_minutes = (now - position.opened_at) / 60
-                never_positive = position.peak_price <= position.entry_price
-                if age_minutes > 10 and never_positive and pnl_pct < 0:
-                    self.logger.warning(
-                        "🛡️ COPY SAFETY NET: Never-positive timeout for %s (Age: %.1fm, PnL: %.1f%%, Peak: $%.8f, Entry: $%.8f)",
-                        position.token.symbol, age_minutes, pnl_pct * 100,
-                        position.peak_price, position.entry_price
-                    )
-                    await self._exit_position(position, "COPY_NEVER_POSITIVE_TIMEOUT")
+                safety = self._copy_safety_check(position, pnl_pct, age_sec, copy_emergency_stop)
+                if safety:
+                    await self._safety_exit(position, *safety)
                     continue
                 # --------------------------------------------------
 
                 # Trailing stop for copy trades in high profit
-                copy_trailing_active = getattr(position, 'copy_trailing_active', False)
-                
                 # Activate trailing when reaching trigger
-                if pnl_pct >= self.settings.COPY_TRAILING_TRIGGER_PCT and not copy_trailing_active:
+                if pnl_pct >= copy_trailing_trigger and not position.copy_trailing_active:
                     position.copy_trailing_active = True
                     position.copy_peak_price = new_price
                     self.logger.info(
                         "🎯 COPY TRAILING ACTIVATED for %s: PnL %.0f%% > %.0f%% trigger, peak=$%.8f",
-                        position.token.symbol, pnl_pct * 100, 
-                        self.settings.COPY_TRAILING_TRIGGER_PCT * 100, new_price
+                        token.symbol, pnl_pct * 100, 
+                        copy_trailing_trigger * 100, new_price
                     )
                     self._notify_telegram("COPY_TRAILING_ARMED", position, 
-                        reason=f"PnL {pnl_pct*100:.0f}% > {self.settings.COPY_TRAILING_TRIGGER_PCT*100:.0f}%")
+                        reason=f"PnL {pnl_pct*100:.0f}% > {copy_trailing_trigger*100:.0f}%")
                 
                 # Check trailing stop if it was previously activated (even if PnL now below trigger!)
-                if getattr(position, 'copy_trailing_active', False):
+                if position.copy_trailing_active:
                     # Update peak price
-                    if new_price > getattr(position, 'copy_peak_price', 0):
+                    if new_price > position.copy_peak_price:
                         position.copy_peak_price = new_price
                     
                     # Check trailing stop
-                    peak = getattr(position, 'copy_peak_price', position.entry_price)
-                    if peak > 0:
+                    peak = position.copy_peak_price or entry_price
+                    # Same as (peak - price) / peak >= COPY_TRAILING_PCT, without the division
+                    if peak > 0 and new_price <= peak * copy_trailing_keep:
                         drop_from_peak = (peak - new_price) / peak
-                        if drop_from_peak >= self.settings.COPY_TRAILING_PCT:
-                            self.logger.info(
-                                "📉 COPY TRAILING STOP for %s: dropped %.1f%% from peak ($%.8f -> $%.8f)",
-                                position.token.symbol, drop_from_peak * 100,
-                                peak, new_price
-                            )
-                            await self._exit_position(position, "COPY_TRAILING_STOP")
-                            continue
+                        self.logger.info(
+                            "📉 COPY TRAILING STOP for %s: dropped %.1f%% from peak ($%.8f -> $%.8f)",
+                            token.symbol, drop_from_peak * 100,
+                            peak, new_price
+                        )
+                        await self._exit_position(position, "COPY_TRAILING_STOP")
+                        continue
                 
                 # Skip all other exit logic for copy trades - wait for COPY_SELL signal
                 continue
 
             # REGULAR TRADE: Normal partial exits and trailing stop
-            for pct, reason in self.partial_exit_manager.maybe_take_partials(
-                position, position.eas_risk_level, position.runner_state, pnl_pct
-            ):
-                await self._execute_partial(position, pct, reason)
-
-            # Hybrid Strategy: Break-Even Trigger
-            if self.settings.BREAK_EVEN_TRIGGER_PCT > 0:
-                if not position.is_breakeven and pnl_pct >= self.settings.BREAK_EVEN_TRIGGER_PCT:
-                    position.is_breakeven = True
-                    self._notify_telegram("BREAK_EVEN_ARMED", position, reason=f"PROFIT > {self.settings.BREAK_EVEN_TRIGGER_PCT*100:.0f}%")
+            if full_tick:
+                for pct, reason in take_partials(
+                    position, position.eas_risk_level, position.runner_state, pnl_pct
+                ):
+                    await self._execute_partial(position, pct, reason)
 
-            trailing_pct = self.trailing_calc.compute(
-                position.runner_state,
-                position.eas_risk_level,
-                position.narrative_phase,
-                roi_pct=pnl_pct * 100.0,
-            )
-            
             # Calculate Stop Price
-            stop_price = position.peak_price * (1.0 - trailing_pct)
-            
-            # START Hybrid Strategy: Break-Even Floor
-            if position.is_breakeven:
-                 # Force stop to be at least Entry + Fees (approx 1%)
-                 be_price = position.entry_price * 1.01
-                 stop_price = max(stop_price, be_price)
+            stop_price = position.peak_price * trailing_keep
+
+            # START Hybrid Strategy: Break-Even Trigger + Floor
+            if position.is_breakeven or 0 < break_even_trigger <= pnl_pct:
+                if not position.is_breakeven:
+                    position.is_breakeven = True
+                    self._notify_telegram("BREAK_EVEN_ARMED", position, reason=f"PROFIT > {break_even_trigger*100:.0f}%")
+                # Force stop to be at least Entry + Fees (approx 1%)
+                be_price = entry_price * break_even_floor
+                if be_price > stop_price:
+                    stop_price = be_price
             # END Hybrid Strategy
             
             # START Hybrid Strategy: Anti-Panic Grace Period
-            is_anti_panic = False
-            if self.settings.ANTI_PANIC_DURATION_SEC > 0:
-                age_sec = now - position.opened_at if position.opened_at > 0 else 0
-                if age_sec < self.settings.ANTI_PANIC_DURATION_SEC:
-                    is_anti_panic = True
+            # Both stops are ignored during the grace period (strict anti-panic)
+            is_anti_panic = anti_panic_sec > 0 and (position.opened_at <= 0 or age_sec < anti_panic_sec)
             # END Hybrid Strategy
 
-            if new_price < stop_price:
-                if is_anti_panic:
-                    # Ignore stop during grace period (unless it's a huge crash? No, strict anti-panic)
-                    pass 
-                else:
+            if stop_price > 0:
+                stop_gap = min(stop_gap, new_price / stop_price - 1.0)
+            if position.state == PositionState.SCOUT:
+                stop_gap = min(stop_gap, pnl_pct - scout_stop_pnl)
+
+            if not is_anti_panic:
+                if new_price < stop_price:
                     await self._exit_position(position, "TRAILING_STOP")
                     continue
 
-            if position.state == PositionState.SCOUT and pnl_pct <= -self.settings.SCOUT_STOP_LOSS_PCT:
-                if is_anti_panic:
-                    pass
-                else:
+                if position.state == PositionState.SCOUT and pnl_pct <= scout_stop_pnl:
                     await self._exit_position(position, "SCOUT_STOP")
                     continue
             
-            # Sync position to Supabase (every ~10 seconds to avoid spam)
-            sync_interval = getattr(position, '_last_supabase_sync', 0)
-            if now - sync_interval > 10:
-                try:
-                    from supabase_sync import safe_upsert, is_enabled
-                    if is_enabled():
-                        safe_upsert('positions', {
-                            'wallet_id': None,  # Optional: set if tracking which wallet owns this
-                            'token_mint': position.token.mint,
-                            'token_symbol': position.token.symbol,
-                            'amount': position.size_sol / position.last_price if position.last_price > 0 else 0,
-                            'avg_buy_price': position.entry_price,
-                            'current_price': position.last_price,
-                            'unrealized_pnl_sol': position.size_sol * pnl_pct,
-                            'unrealized_pnl_percent': pnl_pct * 100,
-                            'is_open': True,
-                        }, conflict_columns=['user_id', 'token_mint'])
-                        position._last_supabase_sync = now
-                except Exception as e:
-                    pass  # Don't break bot if Supabase fails
+            # Sync position to Supabase (every ~10 seconds to avoid spam); the upsert
+            # itself runs on a background worker, off the tick
+            if full_tick and supabase_enabled and position.last_supabase_sync < supabase_cutoff:
+                self._queue_supabase_position({
+                    'wallet_id': None,  # Optional: set if tracking which wallet owns this
+                    'token_mint': token.mint,
+                    'token_symbol': token.symbol,
+                    'amount': position.size_sol / position.last_price if position.last_price > 0 else 0,
+                    'avg_buy_price': position.entry_price,
+                    'current_price': position.last_price,
+                    'unrealized_pnl_sol': position.size_sol * pnl_pct,
+                    'unrealized_pnl_percent': pnl_pct * 100,
+                    'is_open': True,
+                })
+                position.last_supabase_sync = now
         
+        self._stop_gap = stop_gap if stop_gap != float("inf") else 0.0
+
+        if not full_tick:
+            return
+
         # Check bounce watchlist for re-entry opportunities
         bounce_signals = await self.bounce_manager.update_and_check_bounces(now, self.price_feed)
         for signal in bounce_signals:
             await self._handle_bounce_reentry(signal, now)
 
-    async def _handle_transition(self, position: Position, reason: str, new_state: PositionState) -> None:
+    async def _handle_transition(
+        self, position: Position, reason: str, new_state: PositionState, pnl_pct: float
+    ) -> None:
+        """Apply a state-machine transition; pnl_pct is the tick's PnL at position.last_price."""
         if new_state == PositionState.CONFIRM:
-            refresh = getattr(self.scanner, "ensure_holder_stats", None)
-            if callable(refresh):
-                await refresh(position.token)
-            # Calculate current PnL for grace period logic
-            pnl_pct = (position.last_price / position.entry_price) - 1.0 if position.entry_price > 0 else 0.0
+            if self._ensure_holder:
+                await self._ensure_holder(position.token)
+            # Current PnL feeds the RugCheck grace period logic
             rug = await self.rugchecker.check(position.token, position.token.phase, "CONFIRM", current_pnl_pct=pnl_pct)
             if not rug.is_safe:
                 await self._exit_position(position, "CONFIRM_RUGCHECK_FAIL")
@@ -1077,6 +1308,7 @@ class Bot:
                     self.stats.daily_trades += 1
                     self._log_trade("ADD_CONFIRM", position, trade.price, trade.size_sol, reason)
             position.state = PositionState.CONFIRM
+            self._scout_mints.discard(position.token.mint)
             position.selection_consecutive = 0
             position.conviction_consecutive = 0
             self.stats.scout_failures = 0
@@ -1084,11 +1316,9 @@ class Bot:
             return
 
         if new_state == PositionState.CONVICTION:
-            refresh = getattr(self.scanner, "ensure_holder_stats", None)
-            if callable(refresh):
-                await refresh(position.token)
-            # Calculate current PnL for grace period logic
-            pnl_pct = (position.last_price / position.entry_price) - 1.0 if position.entry_price > 0 else 0.0
+            if self._ensure_holder:
+                await self._ensure_holder(position.token)
+            # Current PnL feeds the RugCheck grace period logic
             rug = await self.rugchecker.check(position.token, position.token.phase, "CONVICTION", current_pnl_pct=pnl_pct)
             if not rug.is_safe:
                 await self._exit_position(position, "CONVICTION_RUGCHECK_FAIL")
@@ -1119,7 +1349,8 @@ class Bot:
         if trade.success:
             position.size_sol -= sell_size
             if self.settings.PAPER_TRADING_MODE:
-                value_sol = trade.size_sol * (trade.price / position.entry_price)
+                entry_price = position.entry_price
+                value_sol = trade.size_sol * (trade.price / entry_price if entry_price > 0 else 1.0)
                 pnl_sol = value_sol - trade.size_sol
             else:
                 value_sol = trade.size_sol
@@ -1138,6 +1369,42 @@ class Bot:
             if position.size_sol <= position.initial_size_sol * 0.3 and position.state == PositionState.CONVICTION:
                 position.state = PositionState.MOONBAG
 
+    @staticmethod
+    def _copy_safety_check(
+        position: Position, pnl_pct: float, age_sec: float, emergency_stop: float
+    ) -> tuple | None:
+        """First copy-trade safety net that fires, as (reason, log message, *log args) for _safety_exit."""
+        symbol = position.token.symbol
+        # 1. Emergency Stop Loss: Configurable hard stop with 30s grace period
+        if emergency_stop > 0 and pnl_pct <= -emergency_stop and age_sec > 30:
+            return (
+                "COPY_HARD_STOP_SAFETY",
+                "🛡️ COPY SAFETY NET: Hard stop for %s at %.1f%% (limit %.1f%%)",
+                symbol, pnl_pct * 100, emergency_stop * 100,
+            )
+        if pnl_pct >= 0:
+            return None  # The two timeouts below only apply to losing positions
+        # 2. Zombie Timeout: If > 48 hours old and losing, force exit
+        if age_sec > 48 * 3600 and pnl_pct < -0.10:
+            return (
+                "COPY_TIMEOUT_SAFETY",
+                "🛡️ COPY SAFETY NET: Timeout for %s (Age: %.1fh, PnL: %.1f%%)",
+                symbol, age_sec / 3600, pnl_pct * 100,
+            )
+        # 3. Never-Positive Timeout: If > 10 minutes and NEVER went positive, force exit
+        if age_sec > 600 and position.peak_price <= position.entry_price:
+            return (
+                "COPY_NEVER_POSITIVE_TIMEOUT",
+                "🛡️ COPY SAFETY NET: Never-positive timeout for %s (Age: %.1fm, PnL: %.1f%%, Peak: $%.8f, Entry: $%.8f)",
+                symbol, age_sec / 60, pnl_pct * 100, position.peak_price, position.entry_price,
+            )
+        return None
+
+    async def _safety_exit(self, position: Position, reason: str, message: str, *args: object) -> None:
+        """Log why a safety net fired and close the whole position."""
+        self.logger.warning(message, *args)
+        await self._exit_position(position, reason)
+
     async def _exit_position(self, position: Position, reason: str) -> None:
         # Use sell_all_async to ensure we sell 100% of the token balance in wallet
         # instead of relying on size_sol/price calculation which drift.
@@ -1170,21 +1437,21 @@ class Bot:
                 await self.realtime_feed.unsubscribe(position.token.mint)
                 # Remove from positions dict
                 self.positions.pop(position.token.mint, None)
-                self.event_bus.clear(position.token.mint)
+                self._release_trackers(position.token.mint)
             
             return
 
-        value_sol = trade.size_sol * (trade.price / position.entry_price) if position.entry_price > 0 else trade.size_sol
-        # LiveBroker returns size_sol as actual SOL received on sell.
-        if not self.settings.PAPER_TRADING_MODE:
-            value_sol = trade.size_sol
+        entry_price = position.entry_price
+        price_ratio = trade.price / entry_price if entry_price > 0 else 1.0
+        pnl_pct = price_ratio - 1.0
+        # LiveBroker returns size_sol as actual SOL received on sell; paper fills are
+        # valued at the exit price
+        value_sol = trade.size_sol * price_ratio if self.settings.PAPER_TRADING_MODE else trade.size_sol
         
         pnl_sol = value_sol - position.size_sol # Compare exit value vs cost basis
         position.realized_pnl_sol += pnl_sol
         self.stats.realized_pnl_sol += pnl_sol
         
-        pnl_pct = (trade.price / position.entry_price) - 1.0 if position.entry_price > 0 else 0.0
-        
         if pnl_sol < 0:
             self.stats.daily_loss_sol += abs(pnl_sol)
         self.stats.cash_sol += value_sol
@@ -1213,16 +1480,80 @@ class Bot:
         await self.realtime_feed.unsubscribe(position.token.mint)
         
         self.positions.pop(position.token.mint, None)
-        self.event_bus.clear(position.token.mint)
+        self._release_trackers(position.token.mint)
+        self._save_positions()
+
+    def _release_trackers(self, mint: str) -> None:
+        """Drop per-mint state held by the shared trackers once a position is gone."""
+        self.event_bus.clear(mint)
+        self.lp_monitor.clear(mint)
+        self.dev_tracker.clear(mint)
+        self.entry_scorer.clear(mint)
+        self._risk_inputs.pop(mint, None)
+        self._positions_snapshot = None
+        self._scout_mints.discard(mint)
+        if self.telegram:
+            self.telegram.clear(mint)
+        self._unregister_copy_position(mint)
+
+    @staticmethod
+    def _leader_key(leader_address: str | None, leader_alias: str | None) -> str | None:
+        """Index key for a copy leader: the address, or the alias for legacy positions without one."""
+        if leader_address:
+            return leader_address
+        if leader_alias:
+            return f"alias:{leader_alias}"
+        return None
+
+    def _position_items(self) -> tuple[tuple[str, Position], ...]:
+        """Stable (mint, position) snapshot that survives exits during iteration."""
+        if self._positions_snapshot is None:
+            self._positions_snapshot = tuple(self.positions.items())
+        return self._positions_snapshot
+
+    def _index_position(self, position: Position) -> None:
+        """Add a newly opened or restored position to the scout and copy-trade indexes."""
+        self._positions_snapshot = None
+        if position.state == PositionState.SCOUT:
+            self._scout_mints.add(position.token.mint)
+        self._register_copy_position(position)
+
+    def _register_copy_position(self, position: Position) -> None:
+        """Index an open copy-trade position by mint and leader."""
+        metadata = position.token.metadata
+        if not metadata.get("is_copy_trade", False):
+            return
+        mint = position.token.mint
+        key = self._leader_key(metadata.get("copy_leader_address"), metadata.get("copy_leader"))
+        self._copy_mints[mint] = key
+        if key:
+            self._leader_positions.setdefault(key, set()).add(mint)
+
+    def _unregister_copy_position(self, mint: str) -> None:
+        key = self._copy_mints.pop(mint, None)
+        if key is None:
+            return
+        mints = self._leader_positions.get(key)
+        if mints is not None:
+            mints.discard(mint)
+            if not mints:
+                del self._leader_positions[key]
 
     async def _exit_all_positions(self, reason: str) -> None:
-        for position in list(self.positions.values()):
-            await self._exit_position(position, reason)
+        # Sells are independent swaps: send them together so the last position
+        # doesn't wait behind every other round-trip. _exit_position only touches
+        # self.positions / self.stats between awaits, so interleaving is safe.
+        positions = tuple(self.positions.values())
+        results = await asyncio.gather(
+            *(self._exit_position(position, reason) for position in positions),
+            return_exceptions=True,
+        )
+        for position, result in zip(positions, results):
+            if isinstance(result, Exception):
+                self.logger.error("EXIT %s failed for %s: %s", reason, position.token.symbol, result)
     
-    async def _handle_bounce_reentry(self, signal, now: float) -> None:
+    async def _handle_bounce_reentry(self, signal: BounceSignal, now: float) -> None:
         """Handle bounce recovery re-entry."""
-        from solana_bot.core.bounce_recovery import BounceSignal
-        
         # Skip if we already have a position for this token
         if signal.mint in self.positions:
             self.logger.debug("BOUNCE_SKIP %s: Already have active position", signal.symbol)
@@ -1278,6 +1609,7 @@ class Bot:
         )
         
         self.positions[signal.mint] = position
+        self._index_position(position)
         self.stats.daily_trades += 1
         
         self.logger.info(
@@ -1303,29 +1635,29 @@ class Bot:
                 status_msg = f"🤖 Bot Status: {'🟢 ACTIVE' if self.bot_active else '🔴 STOPPED'}\n"
                 status_msg += f"Positions: {len(self.positions)} open\n"
                 status_msg += f"Cash: {self.stats.cash_sol:.4f} SOL"
-                await self.telegram.send_message(status_msg)
-                await self.telegram.send_status(self.stats, self.positions)
+                self.telegram.queue_message(status_msg)
+                self.telegram.queue_status(self.stats, self.positions)
             if action.kind == "start_bot":
                 if self.bot_active:
-                    await self.telegram.send_message("⚠️ Bot is already running")
+                    self.telegram.queue_message("⚠️ Bot is already running")
                 else:
                     self.bot_active = True
                     self.logger.info("✅ Bot STARTED via Telegram command")
-                    await self.telegram.send_message("✅ Bot started successfully")
+                    self.telegram.queue_message("✅ Bot started successfully")
             if action.kind == "stop_bot":
                 if not self.bot_active:
-                    await self.telegram.send_message("⚠️ Bot is already stopped")
+                    self.telegram.queue_message("⚠️ Bot is already stopped")
                 else:
                     self.bot_active = False
                     self.logger.info("🛑 Bot STOPPED via Telegram command")
-                    await self.telegram.send_message("🛑 Bot stopped successfully. Positions will not be auto-managed.")
+                    self.telegram.queue_message("🛑 Bot stopped successfully. Positions will not be auto-managed.")
             if action.kind == "restart_bot":
                 self.logger.info("🔄 Bot RESTARTING via Telegram command")
-                await self.telegram.send_message("🔄 Restarting bot...")
+                self.telegram.queue_message("🔄 Restarting bot...")
                 self.bot_active = False
                 await asyncio.sleep(2.0)
                 self.bot_active = True
-                await self.telegram.send_message("✅ Bot restarted successfully")
+                self.telegram.queue_message("✅ Bot restarted successfully")
 
     async def _handle_force_sell(self, action: TelegramAction) -> None:
         if not action.mint:
@@ -1334,7 +1666,7 @@ class Bot:
         if position:
             await self._exit_position(position, "FORCE_SELL")
         elif self.telegram:
-            await self.telegram.send_message(f"Nessuna posizione aperta per {action.mint}")
+            self.telegram.queue_message(f"Nessuna posizione aperta per {action.mint}")
 
     def _apply_supervisor(self) -> None:
         if not self.supervisor:
@@ -1374,10 +1706,9 @@ class Bot:
         
         # Also log to Supabase if enabled
         try:
-            from supabase_sync import safe_insert, is_enabled
-            if is_enabled():
-                is_buy = event in ['ENTRY_SCOUT', 'ENTRY_COPY', 'ADD_CONFIRM', 'ADD_CONVICTION', 'ADD_COPY', 'BOUNCE_REENTRY']
-                safe_insert('trades', {
+            if supabase_sync is not None and supabase_sync.is_enabled():
+                is_buy = event in BUY_EVENTS
+                supabase_sync.safe_insert('trades', {
                     'wallet_id': None,  # Optional: for copy trading
                     'position_id': None,  # Optional: link to position
                     'token_mint': position.token.mint,
@@ -1404,12 +1735,60 @@ class Bot:
         extra_str = f" {extra}" if extra else ""
         self.logger.info("%s %s%s", event, token.symbol, extra_str)
 
+    def _queue_supabase_position(self, row: dict) -> None:
+        """Hand a live position row to the Supabase worker; drops it if the worker is backed up."""
+        try:
+            self._supabase_queue.put_nowait(row)
+        except asyncio.QueueFull:
+            self.logger.debug("Supabase queue full, dropping position row for %s", row['token_mint'][:8])
+            return
+        if self._supabase_worker is None or self._supabase_worker.done():
+            self._supabase_worker = asyncio.create_task(self._drain_supabase_positions())
+
+    async def _drain_supabase_positions(self) -> None:
+        while True:
+            # Latest row per mint: one upsert cannot touch the same conflict key twice
+            rows = {}
+            row = await self._supabase_queue.get()
+            rows[row['token_mint']] = row
+            while len(rows) < 50 and not self._supabase_queue.empty():
+                row = self._supabase_queue.get_nowait()
+                rows[row['token_mint']] = row
+            # PostgREST bulk upserts need identical columns on every row, and tick rows
+            # and snapshot rows differ - send one request per column set
+            batches: dict[frozenset, list[dict]] = {}
+            for row in rows.values():
+                batches.setdefault(frozenset(row), []).append(row)
+            for batch in batches.values():
+                # The Supabase client is blocking - keep the request off the event loop
+                await asyncio.to_thread(
+                    supabase_sync.safe_upsert_many, 'positions', batch, ['user_id', 'token_mint']
+                )
+
     def _save_positions(self) -> None:
-        """Save current positions to snapshot immediately."""
-        if hasattr(self, 'position_monitor'):
-            # Force save by resetting timer
-            self.position_monitor._last_log_ts = 0
-            self.position_monitor.maybe_log(self.positions, utc_ts(), self.stats)
+        """Request a positions snapshot; bursts are coalesced into one write."""
+        self._snapshot_dirty.set()
+        if self._snapshot_flusher is None or self._snapshot_flusher.done():
+            self._snapshot_flusher = asyncio.create_task(self._flush_snapshots())
+
+    async def _flush_snapshots(self) -> None:
+        while True:
+            await self._snapshot_dirty.wait()
+            await asyncio.sleep(1.0)  # Debounce: collect every change from the burst
+            self._snapshot_dirty.clear()
+            try:
+                await self._write_positions_snapshot()
+            except Exception as e:
+                self.logger.error("Failed to write positions snapshot: %s", e)
+
+    async def _write_positions_snapshot(self) -> None:
+        # Build the payload on the loop so it is a consistent view of the positions;
+        # the file write blocks, so it runs in a thread, and the Supabase rows go
+        # through the same background worker as the per-tick position rows
+        payload = self.position_monitor.build_payload(self.positions, utc_ts(), self.stats)
+        for row in self.position_monitor.supabase_rows(payload):
+            self._queue_supabase_position(row)
+        await asyncio.to_thread(self.position_monitor.write, payload)
 
     def _notify_telegram(
         self,
@@ -1423,18 +1802,10 @@ class Bot:
             return
         
         # Use cached SOL price for EUR conversion
-        sol_price_eur = self._sol_price_eur
-
-        async def _send() -> None:
-            try:
-                await self.telegram.send_trade_event(
-                    event, position, rug=rug, reason=reason, 
-                    pnl_pct=pnl_pct, sol_price_eur=sol_price_eur
-                )
-            except Exception as exc:
-                self.logger.warning("Telegram notification failed: %s", exc)
-
-        asyncio.create_task(_send())
+        self.telegram.queue_trade_event(
+            event, position, rug=rug, reason=reason,
+            pnl_pct=pnl_pct, sol_price_eur=self._sol_price_eur
+        )
     
     async def _update_sol_price(self) -> None:
         """Update cached SOL price in USD/EUR (called periodically)."""
@@ -178,6 +178,9 @@ class BounceRecoveryManager:
             # Attempt to get price from price feed's cache or live data
             # This will need to be implemented based on your PriceFeed architecture
             if hasattr(price_feed, 'get_price_by_mint'):
+                cached_price = price_feed.get_cached_price(mint)
+                if cached_price is not None:
+                    return cached_price
                 return await price_feed.get_price_by_mint(mint)
             else:
                 # Fallback: we'll need to implement external price fetching
@@ -67,9 +67,10 @@ class CoinGeckoClient:
     async def get_token_price(self, token_address: str) -> float | None:
         """Get token price in USD."""
         # Check cache first
-        now = time.time()
-        if token_address in self._price_cache:
-            cached_price, cached_ts = self._price_cache[token_address]
+        now = time.monotonic()
+        cached = self._price_cache.get(token_address)
+        if cached is not None:
+            cached_price, cached_ts = cached
             if now - cached_ts < self._cache_ttl:
                 return cached_price
         
@@ -108,7 +109,7 @@ class CoinGeckoClient:
         
         result: dict[str, float] = {}
         token_prices = data.get("token_prices", {})
-        now = time.time()
+        now = time.monotonic()
         
         for addr in addresses:
             price_data = token_prices.get(addr, {})
@@ -15,6 +15,14 @@ class StateTransition:
 class ConvexStateMachine:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        # Settings are frozen: cache the thresholds evaluated for every position on every tick
+        self._scout_stop = -settings.SCOUT_STOP_LOSS_PCT
+        self._selection_threshold = settings.CONVEX_SELECTION_THRESHOLD
+        self._confirm_stop = -settings.CONFIRM_STOP_LOSS_PCT
+        self._conviction_threshold = settings.CONVICTION_SCORE_THRESHOLD
+        self._conviction_windows = settings.CONVICTION_CONSECUTIVE_WINDOWS
+        self._confirm_to_conviction_pnl = settings.CONFIRM_TO_CONVICTION_PNL_PCT
+        self._conviction_stop = -settings.CONVICTION_STOP_LOSS_PCT
 
     def evaluate(
         self,
@@ -28,10 +36,10 @@ class ConvexStateMachine:
                 return StateTransition(PositionState.EXIT, "SCOUT_TIMEOUT")
 
             # SAFETY STOP LOSS
-            if pnl_pct <= -self.settings.SCOUT_STOP_LOSS_PCT:
+            if pnl_pct <= self._scout_stop:
                 return StateTransition(PositionState.EXIT, "SCOUT_STOP_LOSS")
 
-            if signals.score >= self.settings.CONVEX_SELECTION_THRESHOLD and signals.anti_fake_ok:
+            if signals.score >= self._selection_threshold and signals.anti_fake_ok:
                 position.selection_consecutive += 1
             else:
                 position.selection_consecutive = 0
@@ -43,23 +51,23 @@ class ConvexStateMachine:
                     return StateTransition(PositionState.CONFIRM, "SELECTION_CONFIRMED")
 
         if position.state == PositionState.CONFIRM:
-            if pnl_pct <= -self.settings.CONFIRM_STOP_LOSS_PCT:
+            if pnl_pct <= self._confirm_stop:
                 return StateTransition(PositionState.EXIT, "CONFIRM_STOP")
-            if signals.score >= self.settings.CONVICTION_SCORE_THRESHOLD and signals.anti_fake_ok:
+            if signals.score >= self._conviction_threshold and signals.anti_fake_ok:
                 position.conviction_consecutive += 1
             else:
                 position.conviction_consecutive = 0
-            if position.conviction_consecutive >= self.settings.CONVICTION_CONSECUTIVE_WINDOWS:
+            if position.conviction_consecutive >= self._conviction_windows:
                 return StateTransition(PositionState.CONVICTION, "CONFIRM_SIGNAL_CONVICTION")
-            if pnl_pct >= self.settings.CONFIRM_TO_CONVICTION_PNL_PCT:
+            if pnl_pct >= self._confirm_to_conviction_pnl:
                 return StateTransition(PositionState.CONVICTION, "CONFIRM_TO_CONVICTION")
 
         if position.state == PositionState.CONVICTION:
-            if pnl_pct <= -self.settings.CONVICTION_STOP_LOSS_PCT:
+            if pnl_pct <= self._conviction_stop:
                 return StateTransition(PositionState.EXIT, "CONVICTION_STOP")
 
         if position.state == PositionState.MOONBAG:
-            if pnl_pct <= -self.settings.CONVICTION_STOP_LOSS_PCT:
+            if pnl_pct <= self._conviction_stop:
                 return StateTransition(PositionState.EXIT, "MOONBAG_STOP")
 
         return None
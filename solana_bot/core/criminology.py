@@ -66,10 +66,11 @@ class DevDetective:
         if not creator:
             return None
             
-        self.logger.info(f"🕵️ Investigo sviluppatore: {creator[:8]}...")
+        self.logger.info("🕵️ Investigo sviluppatore: %s...", creator[:8])
             
-        if creator in self._cache:
-            return self._cache[creator]
+        cached = self._cache.get(creator)
+        if cached is not None:
+            return cached
 
         try:
             session = await self._get_session()
@@ -79,7 +80,7 @@ class DevDetective:
             
             async with session.get(url) as response:
                 if response.status != 200:
-                    self.logger.warning(f"Failed to fetch dev history for {creator}: {response.status}")
+                    self.logger.warning("Failed to fetch dev history for %s: %s", creator, response.status)
                     return None
                 
                 coins = await response.json()
@@ -142,7 +143,7 @@ class DevDetective:
                 return report
                 
         except Exception as e:
-            self.logger.error(f"DevDetective error: {e}")
+            self.logger.error("DevDetective error: %s", e)
             return None
 
     async def close(self) -> None:
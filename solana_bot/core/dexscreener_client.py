@@ -10,6 +10,22 @@ import httpx
 from solana_bot.config import Settings
 
 
+def best_pair_by_liquidity(pairs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Return the pair with the deepest USD liquidity (the first one on ties).
+
+    A single pass without a per-pair key lambda or throwaway ``{}`` defaults.
+    """
+    best = pairs[0]
+    best_usd = -1.0
+    for pair in pairs:
+        liquidity = pair.get("liquidity")
+        usd = liquidity.get("usd") if liquidity else None
+        usd = float(usd) if usd else 0.0
+        if usd > best_usd:
+            best, best_usd = pair, usd
+    return best
+
+
 class DexScreenerClient:
     def __init__(self, settings: Settings, client: httpx.AsyncClient | None = None) -> None:
         self.settings = settings
@@ -23,7 +39,7 @@ class DexScreenerClient:
         await self.client.aclose()
 
     async def get_token_profiles(self) -> list[dict[str, Any]]:
-        now = time.time()
+        now = time.monotonic()
         if self._profiles_cache and (now - self._profiles_cache_ts) < self.settings.DEXSCREENER_PROFILES_TTL_SEC:
             return list(self._profiles_cache)
 
@@ -43,6 +59,23 @@ class DexScreenerClient:
         pairs = payload.get("pairs") if isinstance(payload, dict) else None
         return pairs or []
 
+    async def get_pairs_for_tokens(self, token_addresses: list[str]) -> dict[str, list[dict[str, Any]]]:
+        """Fetch pairs for several tokens, up to 30 addresses per request.
+
+        Returns base token address -> its pairs; tokens without pairs are absent.
+        """
+        by_token: dict[str, list[dict[str, Any]]] = {}
+        for i in range(0, len(token_addresses), 30):
+            chunk = token_addresses[i:i + 30]
+            url = f"{self.base_url}/latest/dex/tokens/{','.join(chunk)}"
+            payload = await self._request(url, log_level="debug")
+            pairs = payload.get("pairs") if isinstance(payload, dict) else None
+            for pair in pairs or []:
+                address = (pair.get("baseToken") or {}).get("address")
+                if address:
+                    by_token.setdefault(address, []).append(pair)
+        return by_token
+
     async def search_pairs(self, query: str) -> list[dict[str, Any]]:
         url = f"{self.base_url}/latest/dex/search"
         payload = await self._request(url, params={"q": query}, log_level="debug")
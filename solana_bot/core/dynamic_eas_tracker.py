@@ -11,9 +11,11 @@ class EASTracker:
         self._high_to_medium = 1.02
 
     def compute(self, signals: SelectionSignals, pnl_pct: float, exec_penalty: float = 0.0) -> float:
-        base = 1.0 + (signals.score / 10.0)
-        momentum = max(0.0, pnl_pct) * 0.4
-        return max(0.1, base + momentum - exec_penalty)
+        # Runs per position every tick: plain comparisons instead of max() calls
+        eas = 1.0 + (signals.score / 10.0) - exec_penalty
+        if pnl_pct > 0.0:
+            eas += pnl_pct * 0.4
+        return eas if eas > 0.1 else 0.1
 
     def update_risk_level(self, current: RiskLevel, eas_value: float) -> RiskLevel:
         if current == RiskLevel.LOW:
@@ -3,10 +3,33 @@ from __future__ import annotations
 from solana_bot.config import Settings
 from solana_bot.core.models import NarrativePhase, RiskLevel, RunnerState
 
+RUNNER_MULTIPLIERS = {
+    RunnerState.NORMAL: 1.0,
+    RunnerState.PRE_RUNNER: 0.9,
+    RunnerState.RUNNER: 0.8,
+    RunnerState.PARABOLIC: 0.6,
+}
+
+RISK_MULTIPLIERS = {
+    RiskLevel.LOW: 1.0,
+    RiskLevel.MEDIUM: 0.85,
+    RiskLevel.HIGH: 0.7,
+}
+
+NARRATIVE_MULTIPLIERS = {
+    NarrativePhase.INFLOW: 1.0,
+    NarrativePhase.NEUTRAL: 0.9,
+    NarrativePhase.DISTRIBUTION: 0.8,
+}
+
 
 class TrailingCalculator:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        # Settings are frozen: resolve the bounds once instead of on every call
+        self._base = settings.BASE_TRAILING_PCT
+        self._min = settings.MIN_TRAILING_PCT
+        self._max = settings.MAX_TRAILING_PCT
 
     def compute(
         self,
@@ -23,7 +46,7 @@ class TrailingCalculator:
         - Tightens if risk is high
         - Loosens for early runners to give breathing room
         """
-        base = self.settings.BASE_TRAILING_PCT
+        base = self._base
         
         # 1. ROI Multiplier: As profit increases, tighten the stop
         if roi_pct <= 0:
@@ -42,29 +65,16 @@ class TrailingCalculator:
         else:
             roi_mult = 0.4  # Extremely tight for moonbags
             
-        runner_mult = {
-            RunnerState.NORMAL: 1.0,
-            RunnerState.PRE_RUNNER: 0.9,
-            RunnerState.RUNNER: 0.8,
-            RunnerState.PARABOLIC: 0.6,
-        }[runner_state]
-        
-        risk_mult = {
-            RiskLevel.LOW: 1.0,
-            RiskLevel.MEDIUM: 0.85,
-            RiskLevel.HIGH: 0.7,
-        }[risk_level]
-        
-        narrative_mult = {
-            NarrativePhase.INFLOW: 1.0,
-            NarrativePhase.NEUTRAL: 0.9,
-            NarrativePhase.DISTRIBUTION: 0.8,
-        }[narrative_phase]
+        runner_mult = RUNNER_MULTIPLIERS[runner_state]
+        risk_mult = RISK_MULTIPLIERS[risk_level]
+        narrative_mult = NARRATIVE_MULTIPLIERS[narrative_phase]
 
         trailing = base * roi_mult * runner_mult * risk_mult * narrative_mult
         
         # Hard limits
-        trailing = max(self.settings.MIN_TRAILING_PCT, trailing)
-        trailing = min(self.settings.MAX_TRAILING_PCT, trailing)
+        if trailing < self._min:
+            trailing = self._min
+        if trailing > self._max:
+            trailing = self._max
         
         return trailing
@@ -7,14 +7,46 @@ from solana_bot.core.models import SelectionSignals, TokenInfo
 class EntryScorer:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        # mint -> (raw metric inputs, signals); metrics only move on a scanner refresh
+        self._cache: dict[str, tuple[tuple, SelectionSignals]] = {}
 
     def score(self, token: TokenInfo) -> SelectionSignals:
         meta = token.metadata
-        m5_buys = int(meta.get("txns_m5_buys", 0))
-        m5_sells = int(meta.get("txns_m5_sells", 0))
-        h1_buys = int(meta.get("txns_h1_buys", 0))
-        h1_sells = int(meta.get("txns_h1_sells", 0))
-        volume_m5 = float(meta.get("volume_m5", 0.0))
+        inputs = (
+            meta.get("txns_m5_buys", 0),
+            meta.get("txns_m5_sells", 0),
+            meta.get("txns_h1_buys", 0),
+            meta.get("txns_h1_sells", 0),
+            meta.get("volume_m5", 0.0),
+            meta.get("price_change_m5", 0.0),
+            meta.get("price_change_h1", 0.0),
+        )
+        cached = self._cache.get(token.mint)
+        if cached is not None and cached[0] == inputs:
+            return cached[1]
+        signals = self._compute(*inputs)
+        self._cache[token.mint] = (inputs, signals)
+        return signals
+
+    def clear(self, mint: str) -> None:
+        """Clear cached signals for a closed position."""
+        self._cache.pop(mint, None)
+
+    @staticmethod
+    def _compute(
+        m5_buys: object,
+        m5_sells: object,
+        h1_buys: object,
+        h1_sells: object,
+        volume_m5: object,
+        price_change_m5: object,
+        price_change_h1: object,
+    ) -> SelectionSignals:
+        m5_buys = int(m5_buys)
+        m5_sells = int(m5_sells)
+        h1_buys = int(h1_buys)
+        h1_sells = int(h1_sells)
+        volume_m5 = float(volume_m5)
 
         m5_total = m5_buys + m5_sells
         h1_total = h1_buys + h1_sells
@@ -24,8 +56,8 @@ class EntryScorer:
         tx_rate_accel = m5_total / baseline_m5
         wallet_influx_accel = m5_buys / baseline_buys
 
-        price_change_m5 = float(meta.get("price_change_m5", 0.0))
-        price_change_h1 = float(meta.get("price_change_h1", 0.0))
+        price_change_m5 = float(price_change_m5)
+        price_change_h1 = float(price_change_h1)
         h1_norm = max(0.01, abs(price_change_h1) / 12.0)
         curve_slope_accel = abs(price_change_m5) / h1_norm
 
@@ -16,19 +16,28 @@ class Event:
 class EventBus:
     def __init__(self) -> None:
         self._events: DefaultDict[str, list[Event]] = defaultdict(list)
+        # Mints whose events already warrant an exit. Events are only ever added
+        # until clear(), so the verdict is decided on publish, not on every check
+        self._exit_mints: set[str] = set()
 
     def publish(self, mint: str, event: Event) -> None:
-        self._events[mint].append(event)
+        events = self._events[mint]
+        events.append(event)
+        if mint not in self._exit_mints and self._warrants_exit(events):
+            self._exit_mints.add(mint)
 
     def get_events(self, mint: str) -> Iterable[Event]:
         return list(self._events.get(mint, []))
 
     def clear(self, mint: str) -> None:
-        if mint in self._events:
-            del self._events[mint]
+        self._events.pop(mint, None)
+        self._exit_mints.discard(mint)
 
     def should_exit(self, mint: str) -> bool:
-        events = self._events.get(mint, [])
+        return mint in self._exit_mints
+
+    @staticmethod
+    def _warrants_exit(events: list[Event]) -> bool:
         if any(evt.level == "CRITICAL" for evt in events):
             return True
         major_roots = {evt.root_cause for evt in events if evt.level == "MAJOR"}
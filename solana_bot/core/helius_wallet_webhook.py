@@ -8,14 +8,15 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import hmac
-import json
 import logging
 import threading
+from collections import defaultdict
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 
 from solana_bot.config import Settings
 from solana_bot.core.wallet_tracker import WalletTracker
+from solana_bot.utils import fast_json
 
 
 # Known DEX program IDs for transaction parsing
@@ -34,6 +35,14 @@ PROGRAM_IDS = {
 # SOL mint address
 SOL_MINT = "So11111111111111111111111111111111111111112"
 
+# Stablecoin mints
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+USDT_MINT = "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB"
+USD1_MINT = "USD1ttGY1N17NEEHvfE8PHr3XM2rv3e12qcNpc4pump"  # USD1 stablecoin
+STABLE_MINTS = (USDC_MINT, USDT_MINT, USD1_MINT)
+# Mints that are never the traded token
+QUOTE_MINTS = frozenset((SOL_MINT,) + STABLE_MINTS)
+
 
 class HeliusWalletWebhook:
     """Webhook server for receiving leader wallet transactions from Helius."""
@@ -122,8 +131,8 @@ class HeliusWalletWebhook:
                         return
                 
                 try:
-                    payload = json.loads(body.decode("utf-8"))
-                except json.JSONDecodeError:
+                    payload = fast_json.loads(body)
+                except ValueError:
                     self.send_response(400)
                     self.end_headers()
                     return
@@ -223,8 +232,8 @@ def _parse_transaction(
     # Analyze token transfers
     sol_out = 0.0  # SOL leaving the wallet
     sol_in = 0.0   # SOL entering the wallet
-    token_out: dict[str, float] = {}  # tokens leaving
-    token_in: dict[str, float] = {}   # tokens entering
+    token_out: defaultdict[str, float] = defaultdict(float)  # tokens leaving
+    token_in: defaultdict[str, float] = defaultdict(float)   # tokens entering
     
     for transfer in native_transfers:
         from_acc = transfer.get("fromUserAccount", "")
@@ -252,11 +261,11 @@ def _parse_transaction(
         else:
             # Other token
             if from_acc == fee_payer:
-                token_out[mint] = token_out.get(mint, 0) + amount
+                token_out[mint] += amount
                 if not token_symbol:
                     token_symbol = symbol
             if to_acc == fee_payer:
-                token_in[mint] = token_in.get(mint, 0) + amount
+                token_in[mint] += amount
                 if not token_symbol:
                     token_symbol = symbol
     
@@ -264,13 +273,6 @@ def _parse_transaction(
     # BUY: SOL/USDC out, token in
     # SELL: token out, SOL/USDC in
     
-    # Stablecoin mints
-    USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
-    USDT_MINT = "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB"
-    USD1_MINT = "USD1ttGY1N17NEEHvfE8PHr3XM2rv3e12qcNpc4pump"  # USD1 stablecoin
-    STABLE_MINTS = (USDC_MINT, USDT_MINT, USD1_MINT)
-
-
     stable_out_usd = sum(token_out.get(m, 0.0) for m in STABLE_MINTS)
     stable_in_usd = sum(token_in.get(m, 0.0) for m in STABLE_MINTS)
 
@@ -280,7 +282,7 @@ def _parse_transaction(
     
     if is_buy_sol or is_buy_stable:
         # Filter out stablecoins from "token_in" (we are buying a target token, not swapping to stable)
-        target_mints = [m for m in token_in.keys() if m not in STABLE_MINTS and m != SOL_MINT]
+        target_mints = [m for m in token_in if m not in QUOTE_MINTS]
         
         if target_mints:
             action = "BUY"
@@ -299,7 +301,7 @@ def _parse_transaction(
         is_sell_stable = any(m in token_in for m in STABLE_MINTS)
         
         # Identify the target token being sold (exclude stables from out)
-        target_mints = [m for m in token_out.keys() if m not in STABLE_MINTS and m != SOL_MINT]
+        target_mints = [m for m in token_out if m not in QUOTE_MINTS]
         
         if (is_sell_sol or is_sell_stable) and target_mints:
             action = "SELL"
@@ -40,7 +40,7 @@ class HeliusWebhook:
         self._server = None
         self.logger.info("Helius webhook stopped")
 
-    async def drain_mints(self) -> list[str]:
+    def drain_mints(self) -> list[str]:
         mints: list[str] = []
         while True:
             try:
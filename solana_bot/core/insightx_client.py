@@ -15,6 +15,20 @@ class InsightXClient:
             "x-api-key": api_key,
             "Content-Type": "application/json"
         }
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        # One keep-alive session for all lookups instead of a TCP+TLS handshake per call
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self.session
+
+    async def close(self) -> None:
+        if self.session and not self.session.closed:
+            await self.session.close()
         
     async def get_token_security(self, mint: str, network: str = "solana") -> Optional[Dict[str, Any]]:
         """
@@ -33,23 +47,23 @@ class InsightXClient:
         url = f"{self.BASE_URL}/tokens/{network}/{mint}"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._parse_security_data(data)
-                    elif response.status == 404:
-                        logger.warning(f"InsightX: Token {mint} not found")
-                        return None
-                    elif response.status == 429:
-                        logger.warning("InsightX: Rate limit exceeded")
-                        return None
-                    else:
-                        logger.error(f"InsightX API error {response.status}: {await response.text()}")
-                        return None
-                        
+            session = await self._get_session()
+            async with session.get(url) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return self._parse_security_data(data)
+                elif response.status == 404:
+                    logger.warning("InsightX: Token %s not found", mint)
+                    return None
+                elif response.status == 429:
+                    logger.warning("InsightX: Rate limit exceeded")
+                    return None
+                else:
+                    logger.error("InsightX API error %s: %s", response.status, await response.text())
+                    return None
+                    
         except Exception as e:
-            logger.error(f"Failed to fetch InsightX data for {mint}: {e}")
+            logger.error("Failed to fetch InsightX data for %s: %s", mint, e)
             return None
             
     def _parse_security_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -71,5 +85,5 @@ class InsightXClient:
                 "warnings": security.get("warnings", [])
             }
         except Exception as e:
-            logger.error(f"Error parsing InsightX data: {e}")
+            logger.error("Error parsing InsightX data: %s", e)
             return {}
@@ -20,6 +20,11 @@ if TYPE_CHECKING:
 
 from solana_bot.core.models import TradeFill
 
+try:
+    from solders.transaction import VersionedTransaction
+except Exception:  # pragma: no cover - optional dependency
+    VersionedTransaction = None
+
 # Solana constants
 SOL_MINT = "So11111111111111111111111111111111111111112"
 WSOL_MINT = SOL_MINT
@@ -120,7 +125,7 @@ class LiveBroker:
 
     async def _get_sol_price_usd(self) -> float:
         """Fetch SOL price in USD (cached)."""
-        now = time.time()
+        now = time.monotonic()
         if self._sol_price_usd > 0 and now - self._sol_price_last_update < self._sol_price_ttl_sec:
             return self._sol_price_usd
 
@@ -239,14 +244,14 @@ class LiveBroker:
             )
 
         # 3. Sign transaction
-        signed_tx = self._sign_transaction(swap_tx)
-        if not signed_tx:
+        signed = self._sign_transaction(swap_tx)
+        if not signed:
             return TradeFill(
                 success=False, side="BUY", mint=mint, size_sol=0.0,
                 price=0.0, reason=f"{reason}_SIGN_FAILED"
             )
 
-        signed_sig = self._extract_signature(signed_tx)
+        signed_tx, signed_sig = signed
 
         # 4. Submit via Jito or direct RPC
         if self.settings.JITO_ENABLED:
@@ -392,14 +397,14 @@ class LiveBroker:
             )
 
         # 3. Sign transaction
-        signed_tx = self._sign_transaction(swap_tx)
-        if not signed_tx:
+        signed = self._sign_transaction(swap_tx)
+        if not signed:
             return TradeFill(
                 success=False, side="SELL", mint=mint, size_sol=0.0,
                 price=0.0, reason=f"{reason}_SIGN_FAILED"
             )
 
-        signed_sig = self._extract_signature(signed_tx)
+        signed_tx, signed_sig = signed
 
         # 4. Submit via Jito or direct RPC
         if self.settings.JITO_ENABLED:
@@ -526,45 +531,36 @@ class LiveBroker:
             self.logger.error("Jupiter swap build failed: %s", e)
             return None
 
-    def _sign_transaction(self, tx_bytes: bytes) -> bytes | None:
-        """Sign a transaction with wallet keypair."""
+    def _sign_transaction(self, tx_bytes: bytes) -> tuple[bytes, str | None] | None:
+        """Sign a transaction with wallet keypair.
+
+        Returns the signed bytes together with the transaction signature, taken
+        from the signed object so the bytes don't have to be parsed again.
+        """
         if not self._wallet_keypair:
             return None
         try:
-            from solders.transaction import VersionedTransaction
-
             # Deserialize
             tx = VersionedTransaction.from_bytes(tx_bytes)
 
             # Recreate transaction with keypairs (it will sign automatically)
             # The constructor expects: VersionedTransaction(message, [signers])
             signed_tx = VersionedTransaction(tx.message, [self._wallet_keypair])
+            signature = str(signed_tx.signatures[0]) if signed_tx.signatures else None
 
-            return bytes(signed_tx)
+            return bytes(signed_tx), signature
 
         except Exception as e:
             self.logger.error("Transaction signing failed: %s", e)
             return None
 
-    def _extract_signature(self, signed_tx: bytes) -> str | None:
-        """Extract the transaction signature from signed bytes."""
-        try:
-            from solders.transaction import VersionedTransaction
-
-            tx = VersionedTransaction.from_bytes(signed_tx)
-            if tx.signatures:
-                return str(tx.signatures[0])
-        except Exception as e:
-            self.logger.debug("Failed to extract signature: %s", e)
-        return None
-
     async def _confirm_signature(self, signature: str, timeout_sec: float = 8.0) -> bool:
         """Best-effort confirmation for a transaction signature."""
         if not signature or not self.settings.RPC_URL:
             return False
 
         client = await self._ensure_client()
-        deadline = time.time() + timeout_sec
+        deadline = time.monotonic() + timeout_sec
         payload = {
             "jsonrpc": "2.0",
             "id": 1,
@@ -572,7 +568,7 @@ class LiveBroker:
             "params": [[signature], {"searchTransactionHistory": True}],
         }
 
-        while time.time() < deadline:
+        while time.monotonic() < deadline:
             try:
                 response = await client.post(self.settings.RPC_URL, json=payload)
                 response.raise_for_status()
@@ -703,6 +699,50 @@ class LiveBroker:
             self.logger.error("Failed to fetch balance: %s", e)
             return None
 
+    async def get_token_balances(self, mints: list[str]) -> dict[str, int]:
+        """Fetch raw token balances for several mints in one JSON-RPC batch request.
+
+        Mints whose lookup errored are left out of the result rather than reported as 0.
+        """
+        if not self._wallet_keypair or not mints:
+            return {}
+
+        mints = [mint.strip() for mint in mints]
+        client = await self._ensure_client()
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "getTokenAccountsByOwner",
+                "params": [
+                    self._wallet_pubkey,
+                    {"mint": mint},
+                    {"encoding": "jsonParsed"}
+                ]
+            }
+            for i, mint in enumerate(mints)
+        ]
+
+        response = await client.post(self.settings.RPC_URL, json=payload)
+        response.raise_for_status()
+        results = response.json()
+        if not isinstance(results, list):
+            raise ValueError(f"Unexpected batch response: {results}")
+
+        balances: dict[str, int] = {}
+        for result in results:
+            idx = result.get("id")
+            if not isinstance(idx, int) or not 0 <= idx < len(mints):
+                continue
+            value = (result.get("result") or {}).get("value")
+            if value is None:
+                continue
+            balances[mints[idx]] = sum(
+                int(acc["account"]["data"]["parsed"]["info"]["tokenAmount"]["amount"])
+                for acc in value
+            )
+        return balances
+
     async def get_token_balance(self, mint: str) -> int:
         """Fetch current token balance (raw amount) from RPC."""
         if not self._wallet_keypair:
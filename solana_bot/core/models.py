@@ -86,7 +86,7 @@ class TradeFill:
     token_amount_raw: int = 0  # Raw token amount (for sells)
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     token: TokenInfo
     state: PositionState
@@ -106,13 +106,16 @@ class Position:
     narrative_phase: NarrativePhase = NarrativePhase.NEUTRAL
     eas_value: float = 1.0
     eas_risk_level: RiskLevel = RiskLevel.LOW
-    partial_exit_flags: set[str] = field(default_factory=set)
+    partial_exit_flags: int = 0  # Bitmask of PARTIAL_* flags from partial_exit_manager
     realized_pct: float = 0.0
     realized_pnl_sol: float = 0.0
     insightx_data: dict[str, Any] = field(default_factory=dict)
     bounce_reentry_count: int = 0  # Track how many times this position is a bounce re-entry
     is_breakeven: bool = False  # Track if break-even stop has been activated
     token_amount_raw: int = 0  # Raw token amount (with decimals) received from buy - for instant sells
+    copy_trailing_active: bool = False  # Copy trades: trailing stop armed past COPY_TRAILING_TRIGGER_PCT
+    copy_peak_price: float = 0.0  # Copy trades: peak price since the trailing stop armed
+    last_supabase_sync: float = 0.0  # Last live-position push to Supabase
 
 
 @dataclass
@@ -3,12 +3,23 @@ from __future__ import annotations
 from solana_bot.config import Settings
 from solana_bot.core.models import Position, RiskLevel, RunnerState
 
+# Bits in Position.partial_exit_flags - one per partial exit that may fire once
+PARTIAL_MOONBAG_ENTRY = 1 << 0
+PARTIAL_MEDIUM = 1 << 1
+PARTIAL_HIGH = 1 << 2
+PARTIAL_PARABOLIC_HIGH = 1 << 3
+PARTIAL_RISK_ALL = PARTIAL_MEDIUM | PARTIAL_HIGH | PARTIAL_PARABOLIC_HIGH
+
 
 class PartialExitManager:
     """Manages both risk-based and profit-based partial exits."""
     
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings
+        # Once every partial that can fire has fired, there is nothing left to check
+        self._done_mask = PARTIAL_RISK_ALL
+        if settings and settings.PARTIAL_EXIT_ENABLED:
+            self._done_mask |= PARTIAL_MOONBAG_ENTRY
     
     def maybe_take_partials(
         self,
@@ -28,33 +39,37 @@ class PartialExitManager:
         Returns:
             List of (exit_percentage, reason) tuples
         """
+        flags = position.partial_exit_flags
+        if flags & self._done_mask == self._done_mask:
+            return []
         partials: list[tuple[float, str]] = []
         
         if self.settings and self.settings.PARTIAL_EXIT_ENABLED:
             # Hybrid Moonbag Logic: Sell 50% at +100% (2x)
             profit_pct = pnl_pct * 100
             trigger_pct = self.settings.MOONBAG_SELL_TRIGGER_PCT * 100 # e.g. 100.0
-            if profit_pct >= trigger_pct and "MOONBAG_ENTRY" not in position.partial_exit_flags:
-                position.partial_exit_flags.add("MOONBAG_ENTRY")
+            if profit_pct >= trigger_pct and not flags & PARTIAL_MOONBAG_ENTRY:
+                flags |= PARTIAL_MOONBAG_ENTRY
                 exit_pct = self.settings.MOONBAG_SELL_PCT # e.g. 0.50
                 partials.append((exit_pct, "MOONBAG_50PCT_PROFIT"))
         
         # 2. RISK-BASED PARTIALS (Original logic - kept for safety)
-        if risk_level == RiskLevel.MEDIUM and "MEDIUM" not in position.partial_exit_flags:
-            position.partial_exit_flags.add("MEDIUM")
+        if risk_level == RiskLevel.MEDIUM and not flags & PARTIAL_MEDIUM:
+            flags |= PARTIAL_MEDIUM
             partials.append((0.20, "PARTIAL_MEDIUM_RISK"))
 
-        if risk_level == RiskLevel.HIGH and "HIGH" not in position.partial_exit_flags:
-            position.partial_exit_flags.add("HIGH")
+        if risk_level == RiskLevel.HIGH and not flags & PARTIAL_HIGH:
+            flags |= PARTIAL_HIGH
             partials.append((0.35, "PARTIAL_HIGH_RISK"))
 
         if (
             risk_level == RiskLevel.HIGH
             and runner_state == RunnerState.PARABOLIC
-            and "PARABOLIC_HIGH" not in position.partial_exit_flags
+            and not flags & PARTIAL_PARABOLIC_HIGH
         ):
-            position.partial_exit_flags.add("PARABOLIC_HIGH")
+            flags |= PARTIAL_PARABOLIC_HIGH
             partials.append((0.25, "PARTIAL_PARABOLIC_HIGH"))
 
+        position.partial_exit_flags = flags
         return partials
 
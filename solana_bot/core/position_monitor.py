@@ -2,15 +2,23 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from solana_bot.config import Settings
 from solana_bot.core.models import Position, PositionState, TokenInfo, Phase, RiskLevel, RunnerState, NarrativePhase
+from solana_bot.utils import fast_json
 
 if TYPE_CHECKING:
     from solana_bot.core.models import BotStats
 
+try:
+    import supabase_sync
+except Exception:  # pragma: no cover - optional dependency
+    supabase_sync = None
+
 
 class PositionMonitor:
     def __init__(self, settings: Settings) -> None:
@@ -18,15 +26,25 @@ class PositionMonitor:
         self.logger = logging.getLogger("solana_bot.positions")
         self.snapshot_path = Path(settings.POSITION_SNAPSHOT_PATH)
         self._last_log_ts = 0.0
+        # write() runs in worker threads: serialize them and never let an older
+        # payload overwrite a newer one
+        self._write_lock = threading.Lock()
+        self._written_ts = 0.0
+
+    def is_due(self, now: float) -> bool:
+        """Whether the periodic snapshot interval has elapsed."""
+        return now - self._last_log_ts >= self.settings.POSITION_LOG_EVERY_SEC
 
-    def maybe_log(
+    def build_payload(
         self,
         positions: dict[str, Position],
         now: float,
         stats: "BotStats | None" = None,
-    ) -> None:
-        if now - self._last_log_ts < self.settings.POSITION_LOG_EVERY_SEC:
-            return
+    ) -> dict:
+        """Snapshot payload for the open positions; also restarts the periodic interval.
+
+        Cheap and in-memory, so call it on the event loop; hand the result to write().
+        """
         self._last_log_ts = now
 
         snapshot = []
@@ -64,7 +82,7 @@ class PositionMonitor:
                     "dev_holding": meta.get("dev_holding", 0),
                     "top10_holding": meta.get("top10_holding", 0),
                     "holder_count": meta.get("holder_count", 0),
-                    "insightx": position.insightx_data,
+                    "insightx": dict(position.insightx_data),  # Serialized off-loop by write()
                     "dex_id": meta.get("dex_id", ""),
                     "phase": position.token.phase.value if hasattr(position.token.phase, 'value') else str(position.token.phase),
                     "bonding_pct": meta.get("bonding_pct", 0),
@@ -89,47 +107,53 @@ class PositionMonitor:
                 "trades_lost": stats.trades_lost,
                 "win_rate": win_rate,
             }
+        return payload
 
-        # ---------------------------------------------------------
-        # SUPABASE SYNC (Push active positions to DB)
-        # ---------------------------------------------------------
-        try:
-            import supabase_sync
-            if supabase_sync.is_enabled():
-                # 1. Sync Positions
-                for pos in snapshot:
-                    # Calculate token amount (approximate from SOL size and price)
-                    price = pos.get("last_price", 0)
-                    size_sol = pos.get("size_sol", 0)
-                    token_amount = (size_sol / price) if price > 0 else 0
-                    
-                    pnl_sol = (pos.get("pnl_pct", 0) * size_sol) # Approx PnL in SOL
-                    
-                    db_position = {
-                        "user_id": supabase_sync.get_user_id(),  # REQUIRED for RLS
-                        "token_mint": pos["mint"],
-                        "token_symbol": pos["symbol"],
-                        "amount": token_amount, # Derived token amount
-                        "avg_buy_price": pos.get("entry_price"),
-                        "current_price": pos.get("last_price"),
-                        "unrealized_pnl_sol": pnl_sol,
-                        "unrealized_pnl_percent": pos.get("pnl_pct", 0) * 100, # Convert to %
-                        "is_open": True,
-                        "updated_at": "now()"
-                    }
-                    supabase_sync.safe_upsert("positions", db_position, conflict_columns=["user_id", "token_mint"])
-
-                # 2. Sync Stats (to wallet/account table if needed, or just logs)
-                # For now, we only sync active positions as that's what the dashboard needs most.
-        except Exception as e:
-            self.logger.error(f"Supabase sync failed: {e}")
+    def write(self, payload: dict) -> None:
+        """Write a build_payload() result to the snapshot file.
+
+        Blocking I/O: run this off the event loop (asyncio.to_thread).
+        """
+        with self._write_lock:
+            if payload["ts"] < self._written_ts:
+                return  # A newer snapshot already went out
+            self._written_ts = payload["ts"]
+            self._write_snapshot(payload)
 
-        self._write_snapshot(payload)
-        # self.logger.info("Positions open=%d", len(snapshot))
+    def supabase_rows(self, payload: dict) -> list[dict]:
+        """Supabase `positions` rows for a build_payload() result (empty when sync is off)."""
+        if supabase_sync is None or not supabase_sync.is_enabled():
+            return []
+        user_id = supabase_sync.get_user_id()  # REQUIRED for RLS
+        db_positions = []
+        for pos in payload["open_positions"]:
+            # Calculate token amount (approximate from SOL size and price)
+            price = pos.get("last_price", 0)
+            size_sol = pos.get("size_sol", 0)
+            token_amount = (size_sol / price) if price > 0 else 0
+            
+            pnl_sol = (pos.get("pnl_pct", 0) * size_sol) # Approx PnL in SOL
+            
+            db_positions.append({
+                "user_id": user_id,
+                "token_mint": pos["mint"],
+                "token_symbol": pos["symbol"],
+                "amount": token_amount, # Derived token amount
+                "avg_buy_price": pos.get("entry_price"),
+                "current_price": pos.get("last_price"),
+                "unrealized_pnl_sol": pnl_sol,
+                "unrealized_pnl_percent": pos.get("pnl_pct", 0) * 100, # Convert to %
+                "is_open": True,
+                "updated_at": "now()"
+            })
+        return db_positions
 
     def _write_snapshot(self, payload: dict) -> None:
         self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
-        self.snapshot_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        # Write-then-rename so readers (dashboard, restart restore) never see a torn file
+        tmp_path = self.snapshot_path.with_suffix(self.snapshot_path.suffix + ".tmp")
+        tmp_path.write_bytes(fast_json.dumps_indented(payload))
+        os.replace(tmp_path, self.snapshot_path)
 
     def load_positions(self) -> dict[str, Position]:
         """Load positions from snapshot file. Returns empty dict if file doesn't exist or is invalid."""
@@ -149,9 +173,10 @@ class PositionMonitor:
             positions: dict[str, Position] = {}
             for pos_data in positions_data:
                 try:
-                    # Reconstruct TokenInfo
+                    # Reconstruct TokenInfo (mints are dict keys: keep them normalized)
+                    mint = pos_data["mint"].strip()
                     token = TokenInfo(
-                        mint=pos_data["mint"],
+                        mint=mint,
                         symbol=pos_data.get("symbol", "???"),
                         age_sec=0,
                         liquidity_usd=pos_data.get("liquidity", 0.0),
@@ -185,7 +210,7 @@ class PositionMonitor:
                         initial_size_sol=pos_data.get("size_sol", 0.0),
                     )
                     
-                    positions[pos_data["mint"]] = position
+                    positions[mint] = position
                     self.logger.info(
                         "Restored position: %s (%s) - Size: %.4f SOL, State: %s",
                         token.symbol, token.mint[:8], position.size_sol, state.value
@@ -8,7 +8,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterable, Union
+
+import httpx
 
 if TYPE_CHECKING:
     from solana_bot.config import Settings
@@ -35,19 +37,27 @@ class PositionPriceMonitor:
         
         # Positions Storage: mint -> Position Object (for PnL calc)
         self._positions: dict[str, "Position"] = {}
+
+        # Volatility: mint -> EWMA of the relative price move between polls
+        self._vol_ewma: dict[str, float] = {}
         
         # Polling control
         self._running = False
         self._poll_task: asyncio.Task | None = None
-        self._poll_interval = 2.0
+        self._poll_interval = settings.PRICE_MONITOR_POLL_SEC
         self._client = None
+        # Jupiter price URL for the current mint set; rebuilt only when positions change
+        self._price_url: str | None = None
+        # Jupiter auth header, built once rather than on every poll
+        self._jupiter_headers: dict[str, str] = (
+            {"x-api-key": settings.JUPITER_API_KEY} if settings.JUPITER_API_KEY else {}
+        )
         
         # Exchange Rates (approx or fetched)
         self._sol_price_usd: float = 0.0
         self._usd_eur_rate: float = 0.96  # Default fallback
     
     async def start(self) -> None:
-        import httpx
         self._client = httpx.AsyncClient(timeout=5.0)
         self._running = True
         self._poll_task = asyncio.create_task(self._poll_loop())
@@ -55,17 +65,29 @@ class PositionPriceMonitor:
     
     async def stop(self) -> None:
         self._running = False
-        if self._poll_task: self._poll_task.cancel()
+        if self._poll_task:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
         if self._client: await self._client.aclose()
         self.logger.info("Position Price Monitor stopped")
     
     def add_position(self, pos: Union[str, "Position"]) -> None:
         """Add a position to monitor. Acccepts mint string (legacy) or Position object."""
         if hasattr(pos, 'token'):
-            # It's a Position object
-            if pos.token.mint not in self._positions:
+            # It's a Position object. The bot re-registers every position on every
+            # tick, so skip the write when this exact object is already tracked
+            mint = pos.token.mint
+            current = self._positions.get(mint, False)
+            if current is pos:
+                return
+            if current is False:
                 self.logger.debug("Added position (with PnL tracking): %s", pos.token.symbol)
-            self._positions[pos.token.mint] = pos
+                self._price_url = None
+            self._positions[mint] = pos
         else:
             # It's a mint string (Legacy fallback)
             # Create a dummy entry if needed, but we prefer objects
@@ -78,22 +100,35 @@ class PositionPriceMonitor:
             # No, keep it clean.
             self.logger.warning("add_position called with string %s, PnL logging disabled for this token", pos[:8])
             # We add to _positions with None value to indicate just price tracking
-            if pos not in self._positions:
-               self._positions[pos] = None
+            self._positions.setdefault(pos, None)
+            self._price_url = None
 
     def remove_position(self, mint: str) -> None:
-        self._positions.pop(mint, None)
+        if self._positions.pop(mint, False) is not False:
+            self._price_url = None
         self._prices.pop(mint, None)
+        self._vol_ewma.pop(mint, None)
     
     def get_price(self, mint: str) -> float | None:
         cached = self._prices.get(mint)
         if cached:
             price, ts = cached
-            if time.time() - ts < 10.0: return price
+            if time.monotonic() - ts < 10.0: return price
         return None
 
+    def get_prices(self, mints: Iterable[str]) -> dict[str, float]:
+        """Fresh prices for several mints at once (same 10s freshness rule as get_price)."""
+        now = time.monotonic()
+        prices = self._prices
+        fresh: dict[str, float] = {}
+        for mint in mints:
+            cached = prices.get(mint)
+            if cached and now - cached[1] < 10.0:
+                fresh[mint] = cached[0]
+        return fresh
+
     def get_all_prices(self) -> dict[str, float]:
-        now = time.time()
+        now = time.monotonic()
         return {m: p for m, (p, ts) in self._prices.items() if now - ts < 10.0}
     
     async def _poll_loop(self) -> None:
@@ -101,29 +136,52 @@ class PositionPriceMonitor:
             try:
                 if self._positions:
                     await self._fetch_prices()
-                await asyncio.sleep(self._poll_interval)
+                await asyncio.sleep(self._next_poll_interval())
             except asyncio.CancelledError: break
             except Exception as e:
                 self.logger.error("Poll error: %s", e)
                 await asyncio.sleep(2.0)
 
+    def _record_price(self, mint: str, price: float, now: float) -> None:
+        """Store a polled price, fold its move into the volatility EWMA and forward it."""
+        previous = self._prices.get(mint)
+        if previous and previous[0] > 0:
+            move = abs(price - previous[0]) / previous[0]
+            self._vol_ewma[mint] = 0.9 * self._vol_ewma.get(mint, move) + 0.1 * move
+        self._prices[mint] = (price, now)
+        if self.realtime_feed: self.realtime_feed.update_price(mint, price)
+
+    def _next_poll_interval(self) -> float:
+        """Scale the poll interval by the most volatile position.
+
+        Moves above PRICE_MONITOR_TARGET_MOVE_PCT per poll shorten the sleep,
+        flat positions stretch it, clamped to the configured min/max.
+        """
+        base = self._poll_interval
+        vols = [self._vol_ewma[mint] for mint in self._positions if mint in self._vol_ewma]
+        if not vols:
+            return base
+        vol = max(vols)
+        if vol <= 0:
+            return self.settings.PRICE_MONITOR_MAX_POLL_SEC
+        interval = base * (self.settings.PRICE_MONITOR_TARGET_MOVE_PCT / vol)
+        return min(max(interval, self.settings.PRICE_MONITOR_MIN_POLL_SEC), self.settings.PRICE_MONITOR_MAX_POLL_SEC)
+
     async def _fetch_prices(self) -> None:
         if not self._positions or not self._client: return
         
-        # Always include SOL for conversion if we have positions
-        mints = list(self._positions.keys())
-        if SOL_MINT not in mints:
-            mints.append(SOL_MINT)
+        url = self._price_url
+        if url is None:
+            # Always include SOL for conversion if we have positions
+            mints = list(self._positions)
+            if SOL_MINT not in self._positions:
+                mints.append(SOL_MINT)
+            url = self._price_url = f"{JUPITER_PRICE_API}?ids={','.join(mints)}"
             
         try:
-            ids = ",".join(mints)
-            url = f"{JUPITER_PRICE_API}?ids={ids}"
-            headers = {}
-            if self.settings.JUPITER_API_KEY:
-                headers["x-api-key"] = self.settings.JUPITER_API_KEY
-            
-            response = await self._client.get(url, headers=headers)
-            updated_logs = []
+            response = await self._client.get(url, headers=self._jupiter_headers)
+            # Price lines are only formatted when INFO logging is on
+            updated_logs: list[str] | None = [] if self.logger.isEnabledFor(logging.INFO) else None
             
             if response.status_code == 200:
                 data = response.json()
@@ -136,20 +194,18 @@ class PositionPriceMonitor:
                 if sol_info:
                     self._sol_price_usd = float(sol_info.get("usdPrice") or sol_info.get("price") or 0)
 
-                for mint in self._positions.keys(): # Only iterate actual positions, ignore SOL if added just for ref
+                for mint, pos in self._positions.items(): # Only iterate actual positions, ignore SOL if added just for ref
                     price_info = prices_data.get(mint)
                     price_found = False
                     
                     if price_info:
                         price = float(price_info.get("usdPrice") or price_info.get("price") or 0)
                         if price > 0:
-                            self._prices[mint] = (price, time.time())
+                            self._record_price(mint, price, time.monotonic())
                             price_found = True
-                            if self.realtime_feed: self.realtime_feed.update_price(mint, price)
                             
                             # Log Construction
-                            pos = self._positions[mint]
-                            if pos:
+                            if pos and updated_logs is not None:
                                 log_entry = self._format_log_entry(pos, price)
                                 updated_logs.append(log_entry)
                     
@@ -158,22 +214,21 @@ class PositionPriceMonitor:
                 if missing: await self._fallback(missing, updated_logs)
                 
                 # Include SOL price in header log
-                header = f"🎯 PRICES [SOL: ${self._sol_price_usd:.2f}]"
                 if updated_logs:
-                    self.logger.info("%s | %s", header, " | ".join(updated_logs))
+                    self.logger.info("🎯 PRICES [SOL: $%.2f] | %s", self._sol_price_usd, " | ".join(updated_logs))
             
             elif response.status_code == 401:
                 self.logger.warning("⚠️ Jupiter 401, using DexScreener")
                 await self._fallback(list(self._positions.keys()), updated_logs)
                 if updated_logs: self.logger.info("🎯 FALLBACK: %s", " | ".join(updated_logs))
             else:
-                 await self._fallback(list(self._positions.keys()), [])
+                 await self._fallback(list(self._positions.keys()), None)
 
         except Exception as e:
             self.logger.error("Fetch error: %s", e)
-            await self._fallback(list(self._positions.keys()), [])
+            await self._fallback(list(self._positions.keys()), None)
 
-    async def _fallback(self, mints: list[str], logs: list[str]) -> None:
+    async def _fallback(self, mints: list[str], logs: list[str] | None) -> None:
         if not self._client: return
         chunk_size = 30
         for i in range(0, len(mints), chunk_size):
@@ -183,21 +238,23 @@ class PositionPriceMonitor:
                 resp = await self._client.get(url)
                 if resp.status_code == 200:
                     data = resp.json()
-                    now = time.time()
+                    now = time.monotonic()
                     processed = set()
-                    for pair in data.get("pairs", []):
-                        mint = pair.get("baseToken", {}).get("address")
-                        if mint not in self._positions or mint in processed: continue
+                    # Unknown tokens come back as {"pairs": null}
+                    for pair in data.get("pairs") or []:
+                        mint = (pair.get("baseToken") or {}).get("address")
+                        # One lookup per pair: False = not monitored, None = legacy price-only entry
+                        pos = self._positions.get(mint, False)
+                        if pos is False or mint in processed: continue
                         price = float(pair.get("priceUsd", 0) or 0)
                         if price > 0:
-                            self._prices[mint] = (price, now)
+                            self._record_price(mint, price, now)
                             processed.add(mint)
-                            if self.realtime_feed: self.realtime_feed.update_price(mint, price)
                             
-                            pos = self._positions[mint]
-                            if pos:
+                            if pos and logs is not None:
                                 logs.append(self._format_log_entry(pos, price) + "[DEX]")
-            except Exception: pass
+            except (httpx.HTTPError, ValueError, TypeError, AttributeError) as e:  # Transport or malformed payload
+                self.logger.debug("DexScreener fallback failed for %d mints: %s", len(chunk), e)
 
     def _format_log_entry(self, pos: "Position", current_price: float) -> str:
         symbol = pos.token.symbol
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Dict, Tuple
 
 from solana_bot.config import Settings
 from solana_bot.core.coingecko_client import CoinGeckoClient
+from solana_bot.core.dexscreener_client import best_pair_by_liquidity
 from solana_bot.core.jupiter_client import JupiterClient
 from solana_bot.core.models import Position
 from solana_bot.utils.time import utc_ts
@@ -43,13 +44,50 @@ class PriceFeed:
         await self.jupiter.close()
         await self.coingecko.close()
 
+    def get_cached_price(self, mint: str, now: float | None = None) -> float | None:
+        """Return the cached price if still within QUOTE_CACHE_TTL_SEC, without awaiting."""
+        cached = self._cache.get(mint)
+        if not cached:
+            return None
+        if now is None:
+            now = utc_ts()
+        if now - cached[0] < self.settings.QUOTE_CACHE_TTL_SEC:
+            return cached[1]
+        return None
+
+    async def prefetch(self, mints: list[str], now: float | None = None) -> None:
+        """Warm the cache for several mints with a single batched CoinGecko request.
+
+        Mints with a fresh cached quote or a live PumpPortal price are skipped, so
+        a following update() for each position resolves without its own round-trip.
+        """
+        if not self.settings.USE_COINGECKO_PRIMARY:
+            return
+        if now is None:
+            now = utc_ts()
+        pending = [
+            mint for mint in mints
+            if self.get_cached_price(mint, now) is None
+            and not (self.pumpportal and self.pumpportal.get_price(mint))
+        ]
+        if len(pending) < 2:
+            return  # Nothing to batch - update() fetches a single mint as before
+        try:
+            prices = await self.coingecko.get_multi_token_prices(pending)
+        except Exception as e:
+            self.logger.debug("CoinGecko batch price failed for %d mints: %s", len(pending), e)
+            return
+        for mint, price in prices.items():
+            if price and price > 0:
+                self._cache[mint] = (now, float(price))
+
     async def update(self, position: Position, now: float | None = None) -> float:
         if now is None:
             now = utc_ts()
         mint = position.token.mint
-        cached = self._cache.get(mint)
-        if cached and now - cached[0] < self.settings.QUOTE_CACHE_TTL_SEC:
-            return cached[1]
+        cached_price = self.get_cached_price(mint, now)
+        if cached_price is not None:
+            return cached_price
 
         # Priority 1: PumpPortal real-time price (for fresh Pump.fun tokens)
         if self.pumpportal:
@@ -74,10 +112,7 @@ class PriceFeed:
                 pairs = await self.dexscreener.get_token_pairs(mint)
                 if pairs:
                     # Sort by liquidity/volume to find best pair
-                    best_pair = max(
-                        pairs, 
-                        key=lambda p: float(p.get("liquidity", {}).get("usd", 0) or 0)
-                    )
+                    best_pair = best_pair_by_liquidity(pairs)
                     price = float(best_pair.get("priceUsd", 0) or 0)
                     if price > 0:
                         self._cache[mint] = (now, price)
@@ -108,9 +143,10 @@ class PriceFeed:
         now = utc_ts()
         
         # Check cache first
+        cached_price = self.get_cached_price(mint, now)
+        if cached_price is not None:
+            return cached_price
         cached = self._cache.get(mint)
-        if cached and now - cached[0] < self.settings.QUOTE_CACHE_TTL_SEC:
-            return cached[1]
         
         # Try PumpPortal first
         if self.pumpportal:
@@ -135,10 +171,7 @@ class PriceFeed:
                 pairs = await self.dexscreener.get_token_pairs(mint)
                 if pairs:
                     # Sort by liquidity
-                    best_pair = max(
-                        pairs, 
-                        key=lambda p: float(p.get("liquidity", {}).get("usd", 0) or 0)
-                    )
+                    best_pair = best_pair_by_liquidity(pairs)
                     price = float(best_pair.get("priceUsd", 0) or 0)
                     if price > 0:
                         self._cache[mint] = (now, price)
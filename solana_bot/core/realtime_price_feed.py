@@ -3,7 +3,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
+
+from solana_bot.core.models import Phase
 
 if TYPE_CHECKING:
     from solana_bot.core.models import TokenInfo
@@ -41,6 +43,8 @@ class RealTimePriceFeed:
         # Latest prices from all sources
         self._prices: dict[str, float] = {}
         self._price_timestamps: dict[str, float] = {}
+        # Set whenever a subscribed token receives a price; bursts conflate into one wake-up
+        self._price_event = asyncio.Event()
         
         # Health monitoring
         self._running = False
@@ -89,8 +93,7 @@ class RealTimePriceFeed:
         self._subscriptions[mint] = token
         
         # Determine the best source based on token phase
-        phase = getattr(token, 'phase', None)
-        is_bonding = phase and 'BONDING' in str(phase).upper()
+        is_bonding = token.phase == Phase.BONDING_CURVE
         
         if is_bonding and self.pumpportal:
             # Use PumpPortal WebSocket for bonding curve tokens
@@ -103,17 +106,18 @@ class RealTimePriceFeed:
 
     async def unsubscribe(self, mint: str) -> None:
         """Unsubscribe from price updates for a token."""
-        if mint in self._subscriptions:
-            token = self._subscriptions.pop(mint)
-            
-            # Stop Birdeye polling if applicable
-            await self.birdeye.stop_polling({mint})
-            
-            # Clean up cached data
-            self._prices.pop(mint, None)
-            self._price_timestamps.pop(mint, None)
-            
-            self.logger.debug("Unsubscribed from %s", token.symbol)
+        token = self._subscriptions.pop(mint, None)
+        if token is None:
+            return
+
+        # Stop Birdeye polling if applicable
+        await self.birdeye.stop_polling({mint})
+
+        # Clean up cached data
+        self._prices.pop(mint, None)
+        self._price_timestamps.pop(mint, None)
+
+        self.logger.debug("Unsubscribed from %s", token.symbol)
 
     def get_latest_price(self, mint: str) -> float | None:
         """
@@ -125,7 +129,7 @@ class RealTimePriceFeed:
         timestamp = self._price_timestamps.get(mint)
         
         if price and timestamp:
-            age = time.time() - timestamp
+            age = time.monotonic() - timestamp
             if age < self.settings.REALTIME_STALE_THRESHOLD_SEC:
                 return price
             else:
@@ -139,19 +143,46 @@ class RealTimePriceFeed:
         
         return None
 
+    def get_latest_prices(self, mints: Iterable[str]) -> dict[str, float]:
+        """Bulk get_latest_price: every mint with a known positive price, stale ones included."""
+        prices = self._prices
+        timestamps = self._price_timestamps
+        latest: dict[str, float] = {}
+        for mint in mints:
+            price = prices.get(mint)
+            if price and price > 0 and timestamps.get(mint):
+                latest[mint] = price
+        return latest
+
     def update_price(self, mint: str, price: float) -> None:
         """Update the cached price for a token (called by PumpPortal or other sources)."""
         self._prices[mint] = price
-        self._price_timestamps[mint] = time.time()
+        self._price_timestamps[mint] = time.monotonic()
+        if mint in self._subscriptions:
+            self._price_event.set()
         self.logger.debug("Updated price for %s: $%.6f", mint[:8], price)
 
+    async def wait_for_update(self, timeout: float) -> bool:
+        """Wait until a subscribed token gets a new price, or until timeout.
+
+        Returns True if woken by a price update. Updates that arrived since the
+        previous call wake immediately.
+        """
+        if not self._price_event.is_set():
+            try:
+                await asyncio.wait_for(self._price_event.wait(), timeout)
+            except asyncio.TimeoutError:
+                return False
+        self._price_event.clear()
+        return True
+
     def set_initial_price(self, mint: str, price: float) -> None:
         """
         Manually set the initial price for a token (e.g. from trade execution).
         Useful to avoid '0 PnL' or stale waiting period immediately after buy.
         """
         self._prices[mint] = price
-        self._price_timestamps[mint] = time.time()
+        self._price_timestamps[mint] = time.monotonic()
         self.logger.info("Set initial price for %s: $%.6f (from execution)", mint[:8], price)
 
     async def _health_check_loop(self) -> None:
@@ -161,7 +192,7 @@ class RealTimePriceFeed:
         while self._running:
             await asyncio.sleep(self.settings.REALTIME_STALE_THRESHOLD_SEC)
             
-            now = time.time()
+            now = time.monotonic()
             for mint, token in list(self._subscriptions.items()):
                 last_update = self._price_timestamps.get(mint, 0)
                 age = now - last_update
@@ -190,22 +221,15 @@ class RealTimePriceFeed:
                     self.logger.info("Fallback refresh successful for %s: $%.6f", token.symbol, price)
 
                     # Check if we need to switch from PumpPortal to Birdeye (Migration detection)
-                    phase = getattr(token, 'phase', '')
-                    is_bonding = phase and 'BONDING' in str(phase).upper()
+                    is_bonding = token.phase == Phase.BONDING_CURVE
                     
                     if is_bonding and self.pumpportal:
                         # If we are here, it means PumpPortal is silent (stale) but DexScreener has data.
                         # This strongly suggests the token has migrated.
                         self.logger.info("Token %s seems to have migrated (DexScreener active), switching to Birdeye", token.symbol)
                         
-                        # Attempt to unsubscribe from PumpPortal (best effort)
-                        try:
-                            # Note: PumpPortal client doesn't have explicit unsubscribe per token in this version easily accessible
-                            # without checking the implementation, but we can just start Birdeye polling.
-                            # The PumpPortal client receives all trades for subscribed tokens. 
-                            pass 
-                        except Exception:
-                            pass
+                        # Note: PumpPortal client doesn't have explicit unsubscribe per token in this version,
+                        # so we just start Birdeye polling alongside it.
                         
                         # Switch to Birdeye
                         await self.birdeye.start_polling({token.mint})
@@ -23,7 +23,7 @@ class TTLCache:
             self._stats.misses += 1
             return None
         expiry, value = entry
-        if time.time() > expiry:
+        if time.monotonic() > expiry:
             self._store.pop(key, None)
             self._stats.misses += 1
             return None
@@ -31,7 +31,7 @@ class TTLCache:
         return value
 
     def set(self, key: str, value: object, ttl_sec: int) -> None:
-        self._store[key] = (time.time() + ttl_sec, value)
+        self._store[key] = (time.monotonic() + ttl_sec, value)
 
     def print_stats(self) -> None:
         total = self._stats.hits + self._stats.misses
@@ -46,10 +46,10 @@ class CreditLimiter:
         self._hourly_budget = 5000
         self._usage_daily = 0
         self._usage_hourly = 0
-        self._last_hour = time.time()
+        self._last_hour = time.monotonic()
 
     def record(self, cost: int = 1) -> None:
-        now = time.time()
+        now = time.monotonic()
         if now - self._last_hour >= 3600:
             self._usage_hourly = 0
             self._last_hour = now
@@ -87,7 +87,7 @@ class RPCClient:
         encoded = data[0] if isinstance(data, list) else data
         try:
             raw = base64.b64decode(encoded)
-        except Exception:
+        except ValueError:  # binascii.Error
             return None
         return parse_mint_account(raw)
 
@@ -112,7 +112,7 @@ class Rugchecker:
                  is_safe = True
             
             if self.settings.RUGCHECK_DETAILED_LOGGING:
-                 logger.info(f"🛡️ Rugcheck LENIENT for {token.symbol} (PnL +{current_pnl_pct*100:.1f}%) -> Safe={is_safe}")
+                 logger.info("🛡️ Rugcheck LENIENT for %s (PnL +%.1f%%) -> Safe=%s", token.symbol, current_pnl_pct*100, is_safe)
         
         elif mode in ("CONVICTION", "MOONBAG") and self.settings.RUGCHECK_DISABLE_ON_CONVICTION:
             # Disable rugcheck on CONVICTION if configured
@@ -122,7 +122,7 @@ class Rugchecker:
             flags.append(grace_reason)
             
             if self.settings.RUGCHECK_DETAILED_LOGGING:
-                logger.info(f"🎯 Rugcheck DISABLED for {token.symbol} - CONVICTION mode bypass")
+                logger.info("🎯 Rugcheck DISABLED for %s - CONVICTION mode bypass", token.symbol)
         
         else:
             # No grace period - apply standard rugcheck
@@ -153,9 +153,9 @@ class Rugchecker:
                           risk_level = "CRITICAL"
                      
                      if not is_safe and self.settings.RUGCHECK_DETAILED_LOGGING:
-                         logger.warning(f"🎯 RugCheck API REJECTED {token.symbol}: Score {report.score}")
+                         logger.warning("🎯 RugCheck API REJECTED %s: Score %s", token.symbol, report.score)
              except Exception as e:
-                 logger.error(f"RugCheck API failed: {e}")
+                 logger.error("RugCheck API failed: %s", e)
 
         # Detailed logging of rugcheck results
         if self.settings.RUGCHECK_DETAILED_LOGGING:
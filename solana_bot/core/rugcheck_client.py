@@ -42,11 +42,11 @@ class RugCheckClient:
             
             async with session.get(url) as response:
                 if response.status == 404:
-                    self.logger.warning(f"RugCheck: Report not found for {mint}")
+                    self.logger.warning("RugCheck: Report not found for %s", mint)
                     return None
                 
                 if response.status != 200:
-                    self.logger.error(f"RugCheck API Error {response.status}: {await response.text()}")
+                    self.logger.error("RugCheck API Error %s: %s", response.status, await response.text())
                     return None
                 
                 data = await response.json()
@@ -61,15 +61,15 @@ class RugCheckClient:
                 if score_normalised is not None and score_normalised > 0:
                     # Use normalised score (0-100)
                     score = int(score_normalised)
-                    self.logger.debug(f"RugCheck {mint[:8]}: Using normalised score {score}")
+                    self.logger.debug("RugCheck %s: Using normalised score %s", mint[:8], score)
                 else:
                     # Use raw score - note: 501 seems to be default for new/unknown tokens
                     score = int(score_raw)
                     if score == 501:
                         # 501 appears to be a "unknown/new token" score, treat as low risk
-                        self.logger.debug(f"RugCheck {mint[:8]}: Score 501 (likely new token), treating as low risk")
+                        self.logger.debug("RugCheck %s: Score 501 (likely new token), treating as low risk", mint[:8])
                     else:
-                        self.logger.debug(f"RugCheck {mint[:8]}: Using raw score {score}")
+                        self.logger.debug("RugCheck %s: Using raw score %s", mint[:8], score)
                 
                 # Detect critical risks (only if explicitly flagged as danger)
                 critical_risks = [
@@ -89,7 +89,7 @@ class RugCheckClient:
                 )
                 
         except Exception as e:
-            self.logger.error(f"RugCheck Exception: {e}")
+            self.logger.error("RugCheck Exception: %s", e)
             return None
 
     async def close(self) -> None:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from html import escape
 from typing import Any
@@ -11,6 +12,9 @@ import httpx
 from solana_bot.config import Settings
 from solana_bot.core.models import BotStats, Position, RugcheckResult, TokenInfo
 
+# Telegram rejects sendMessage texts longer than this
+TELEGRAM_MAX_MESSAGE_LEN = 4096
+
 
 @dataclass(frozen=True)
 class TelegramAction:
@@ -31,13 +35,72 @@ class TelegramNotifier:
         self.logger = logging.getLogger("solana_bot.telegram")
         self._last_update_id = 0
         self._last_poll_ts = 0.0
+        # Alerts go through a bounded queue so the trading loop never waits on Telegram
+        self._queue: asyncio.Queue[tuple[tuple[str, str] | None, str, list[list[dict[str, Any]]] | None]] = (
+            asyncio.Queue(maxsize=settings.TELEGRAM_QUEUE_MAX_SIZE)
+        )
+        # coalesce key -> latest (text, buttons) for an alert still waiting in the queue
+        self._coalesced: dict[tuple[str, str], tuple[str, list[list[dict[str, Any]]] | None]] = {}
+        self._worker: asyncio.Task | None = None
+        # Queued message pulled while batching that has to go out on its own next
+        self._held: tuple[str, list[list[dict[str, Any]]] | None] | None = None
+        # mint -> (event, reason) -> monotonic time of the last alert, for the cooldown
+        self._last_alert: dict[str, dict[tuple[str, str], float]] = {}
+        # Set while close() flushes the queue: send back-to-back instead of pacing
+        self._flushing = False
+        # getUpdates runs in the background; the bot collects finished actions each tick
+        self._poll_task: asyncio.Task | None = None
+        self._pending_actions: list[TelegramAction] = []
 
     async def close(self) -> None:
+        if self._worker and not self._worker.done():
+            # Deliver what is still queued (e.g. the SHUTDOWN exit alerts) before
+            # tearing down the sender, but never hold shutdown up indefinitely
+            self._flushing = True
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=self.settings.TELEGRAM_CLOSE_FLUSH_SEC)
+            except asyncio.TimeoutError:
+                self.logger.warning("Telegram flush timed out, dropping %d queued alerts", self._queue.qsize())
+        if self._worker:
+            self._worker.cancel()
+            self._worker = None
+        if self._poll_task:
+            self._poll_task.cancel()
+            self._poll_task = None
         await self.client.aclose()
 
     async def send_message(self, text: str, buttons: list[list[dict[str, Any]]] | None = None) -> None:
         if not self.enabled:
             return
+        await self._post("sendMessage", self._message_payload(text, buttons))
+
+    def queue_message(
+        self,
+        text: str,
+        buttons: list[list[dict[str, Any]]] | None = None,
+        coalesce_key: tuple[str, str] | None = None,
+    ) -> None:
+        """Queue a message for the background sender and return immediately.
+
+        While a message with the same coalesce_key is still waiting, it is
+        replaced by the newer text instead of queueing a second message.
+        """
+        if not self.enabled:
+            return
+        if coalesce_key is not None and coalesce_key in self._coalesced:
+            self._coalesced[coalesce_key] = (text, buttons)
+            return
+        try:
+            self._queue.put_nowait((coalesce_key, text, buttons))
+        except asyncio.QueueFull:
+            self.logger.warning("Telegram queue full, dropping message")
+            return
+        if coalesce_key is not None:
+            self._coalesced[coalesce_key] = (text, buttons)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain_queue())
+
+    def _message_payload(self, text: str, buttons: list[list[dict[str, Any]]] | None) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "chat_id": self.chat_id,
             "text": text,
@@ -46,9 +109,9 @@ class TelegramNotifier:
         }
         if buttons:
             payload["reply_markup"] = {"inline_keyboard": buttons}
-        await self._post("sendMessage", payload)
+        return payload
 
-    async def send_trade_event(
+    def queue_trade_event(
         self,
         event: str,
         position: Position,
@@ -57,40 +120,132 @@ class TelegramNotifier:
         pnl_pct: float | None = None,
         sol_price_eur: float | None = None,
     ) -> None:
-        if not self.enabled:
-            return
-        text = build_trade_message(event, position, rug, reason, pnl_pct, sol_price_eur)
-        buttons = build_buttons(self.settings, position.token)
-        await self.send_message(text, buttons)
+        """Queue a trade alert for the background sender.
 
-    async def send_status(self, stats: BotStats, positions: dict[str, Position]) -> None:
+        The message is rendered immediately so it reflects the position at the
+        time of the event. Repeats of the same alert for a mint inside
+        TELEGRAM_ALERT_COOLDOWN_SEC are dropped; exits are always delivered.
+        """
         if not self.enabled:
             return
-        text = build_status_message(stats, positions)
-        await self.send_message(text)
+        coalesce_key = None
+        if event != "EXIT":
+            coalesce_key = (event, position.token.mint)
+            key = (event, reason or "")
+            now = time.monotonic()
+            mint_alerts = self._last_alert.setdefault(position.token.mint, {})
+            if now - mint_alerts.get(key, float("-inf")) < self.settings.TELEGRAM_ALERT_COOLDOWN_SEC:
+                return
+            mint_alerts[key] = now
+        text = build_trade_message(event, position, rug, reason, pnl_pct, sol_price_eur)
+        self.queue_message(text, build_buttons(self.settings, position.token), coalesce_key=coalesce_key)
+
+    def clear(self, mint: str) -> None:
+        """Forget alert cooldowns for a mint once its position is closed."""
+        self._last_alert.pop(mint, None)
+
+    def _resolve(
+        self, item: tuple[tuple[str, str] | None, str, list[list[dict[str, Any]]] | None]
+    ) -> tuple[str, list[list[dict[str, Any]]] | None]:
+        """Swap a coalesced queue entry for the latest text queued under its key."""
+        coalesce_key, text, buttons = item
+        if coalesce_key is not None:
+            return self._coalesced.pop(coalesce_key, (text, buttons))
+        return text, buttons
+
+    def _batch_plain(self, text: str) -> tuple[str, int]:
+        """Append already-queued plain messages to text while they fit in one Telegram message.
+
+        Returns the combined text and how many queue entries it consumed. Messages
+        with buttons are never merged; the first one met is held for the next send.
+        """
+        parts = [text]
+        size = len(text)
+        while not self._queue.empty():
+            next_text, buttons = self._resolve(self._queue.get_nowait())
+            if buttons or size + 2 + len(next_text) > TELEGRAM_MAX_MESSAGE_LEN:
+                self._held = (next_text, buttons)
+                break
+            parts.append(next_text)
+            size += 2 + len(next_text)
+        return "\n\n".join(parts), len(parts)
+
+    async def _drain_queue(self) -> None:
+        """Send queued alerts one at a time, honouring Telegram's rate limits.
+
+        Plain-text messages that pile up behind the rate limit go out as one
+        combined message instead of one request each.
+        """
+        while True:
+            if self._held is not None:
+                text, buttons = self._held
+                self._held = None
+            else:
+                text, buttons = self._resolve(await self._queue.get())
+            consumed = 1
+            if not buttons:
+                text, consumed = self._batch_plain(text)
+            try:
+                payload = self._message_payload(text, buttons)
+                data = await self._post("sendMessage", payload)
+                retry_after = (data.get("parameters") or {}).get("retry_after") if isinstance(data, dict) else None
+                if retry_after:
+                    try:
+                        delay = float(retry_after)
+                    except (TypeError, ValueError):  # malformed retry_after
+                        delay = self.settings.TELEGRAM_MIN_SEND_INTERVAL_SEC
+                    self.logger.warning("Telegram rate limited, retrying in %ss", delay)
+                    await asyncio.sleep(delay)
+                    await self._post("sendMessage", payload)
+            except Exception as exc:  # Keep the sender alive; cancellation still propagates
+                self.logger.warning("Telegram notification failed: %s", exc)
+            finally:
+                for _ in range(consumed):
+                    self._queue.task_done()
+            if not self._flushing:
+                await asyncio.sleep(self.settings.TELEGRAM_MIN_SEND_INTERVAL_SEC)
+
+    def queue_status(self, stats: BotStats, positions: dict[str, Position]) -> None:
+        self.queue_message(build_status_message(stats, positions))
 
     async def poll_actions(self, now: float) -> list[TelegramAction]:
+        """Return actions fetched since the last call and start the next poll if due.
+
+        The getUpdates round-trip runs as a background task so the trading
+        loop never waits on it; its actions are handed out on a later tick.
+        """
         if not self.enabled or not self.settings.TELEGRAM_POLL_UPDATES:
             return []
-        if now - self._last_poll_ts < self.settings.TELEGRAM_POLL_INTERVAL_SEC:
-            return []
-        self._last_poll_ts = now
-        updates = await self._get_updates()
-        actions: list[TelegramAction] = []
-        for update in updates:
-            update_id = update.get("update_id")
-            if isinstance(update_id, int) and update_id >= self._last_update_id:
-                self._last_update_id = update_id + 1
-            if "callback_query" in update:
-                action = self._handle_callback(update["callback_query"])
-                if action:
-                    actions.append(action)
-            if "message" in update:
-                action = self._handle_message(update["message"])
-                if action:
-                    actions.append(action)
+        actions, self._pending_actions = self._pending_actions, []
+        polling = self._poll_task is not None and not self._poll_task.done()
+        if not polling and now - self._last_poll_ts >= self.settings.TELEGRAM_POLL_INTERVAL_SEC:
+            self._last_poll_ts = now
+            self._poll_task = asyncio.create_task(self._fetch_actions())
         return actions
 
+    async def _fetch_actions(self) -> None:
+        try:
+            updates = await self._get_updates()
+        except Exception as exc:  # e.g. httpx.InvalidURL, which _post does not absorb
+            self.logger.warning("Telegram getUpdates failed: %s", exc)
+            return
+        actions = self._pending_actions
+        for update in updates:
+            try:
+                update_id = update.get("update_id")
+                if isinstance(update_id, int) and update_id >= self._last_update_id:
+                    self._last_update_id = update_id + 1
+                if "callback_query" in update:
+                    action = self._handle_callback(update["callback_query"])
+                    if action:
+                        actions.append(action)
+                if "message" in update:
+                    action = self._handle_message(update["message"])
+                    if action:
+                        actions.append(action)
+            except (AttributeError, TypeError) as exc:  # Malformed update: skip just this one
+                self.logger.warning("Ignoring malformed Telegram update: %s", exc)
+
     def _handle_callback(self, payload: dict[str, Any]) -> TelegramAction | None:
         data = payload.get("data")
         callback_id = payload.get("id")
@@ -160,9 +315,12 @@ class TelegramNotifier:
                 response = await self.client.get(url, params=payload)
             else:
                 response = await self.client.post(url, json=payload)
+            if response.status_code == 429:
+                # Body carries parameters.retry_after for the caller to honour
+                return response.json()
             response.raise_for_status()
             return response.json()
-        except httpx.HTTPError as exc:
+        except (httpx.HTTPError, ValueError) as exc:  # ValueError: non-JSON body
             self.logger.warning("Telegram %s failed: %s", method, exc)
             return {}
 
@@ -198,6 +356,19 @@ def build_buttons(settings: Settings, token: TokenInfo) -> list[list[dict[str, A
     return buttons
 
 
+_TRADE_HEADERS = {
+    "SCOUT_OPEN": "🔭 <b>NUOVO SCOUT ENTRY</b>",
+    "STATE_CHANGE": "🔄 <b>AGGIORNAMENTO STATO</b>",
+    "EXIT": "🚪 <b>USCITA POSIZIONE</b>",
+    "SCOUT_STOP": "🛑 <b>STOP LOSS (Scout)</b>",
+    "TRAILING_STOP": "📉 <b>TRAILING STOP</b>",
+    "TAKE_PROFIT": "💰 <b>TAKE PROFIT</b>",
+    "COPY_TRAILING_ARMED": "🎯 <b>COPY TRAILING ATTIVATO</b>",
+    "COPY_TRAILING_STOP": "📉 <b>COPY TRAILING STOP</b>",
+    "COPY_EMERGENCY_STOP": "🛑 <b>COPY EMERGENCY STOP</b>",
+}
+
+
 def build_trade_message(
     event: str,
     position: Position,
@@ -209,18 +380,7 @@ def build_trade_message(
     token = position.token
     
     # --- HEADER ---
-    header_map = {
-        "SCOUT_OPEN": "🔭 <b>NUOVO SCOUT ENTRY</b>",
-        "STATE_CHANGE": "🔄 <b>AGGIORNAMENTO STATO</b>",
-        "EXIT": "🚪 <b>USCITA POSIZIONE</b>",
-        "SCOUT_STOP": "🛑 <b>STOP LOSS (Scout)</b>",
-        "TRAILING_STOP": "📉 <b>TRAILING STOP</b>",
-        "TAKE_PROFIT": "💰 <b>TAKE PROFIT</b>",
-        "COPY_TRAILING_ARMED": "🎯 <b>COPY TRAILING ATTIVATO</b>",
-        "COPY_TRAILING_STOP": "📉 <b>COPY TRAILING STOP</b>",
-        "COPY_EMERGENCY_STOP": "🛑 <b>COPY EMERGENCY STOP</b>",
-    }
-    header = header_map.get(event, f"🔔 <b>{event}</b>")
+    header = _TRADE_HEADERS.get(event) or f"🔔 <b>{event}</b>"
     
     # Check if this is a copy trade and get leader info
     is_copy_trade = token.metadata.get("is_copy_trade", False)
@@ -228,7 +388,7 @@ def build_trade_message(
     
     # Add COPY indicator to header if it's a copy trade
     if is_copy_trade and event == "SCOUT_OPEN":
-        header = f"📡 <b>COPY TRADE ENTRY</b>"
+        header = "📡 <b>COPY TRADE ENTRY</b>"
 
     # --- DATA PREP ---
     age_min = int(token.age_sec / 60) if token.age_sec else 0
@@ -253,7 +413,7 @@ def build_trade_message(
     
     # --- MESSAGE BODY ---
     lines = [
-        f"{header}",
+        header,
         f"💎 <b>{symbol}</b> | <code>{mint}</code>",
     ]
     
@@ -263,14 +423,14 @@ def build_trade_message(
     
     lines.extend([
         "",
-        f"📊 <b>Posizione</b>",
+        "📊 <b>Posizione</b>",
         f"• Stato: <b>{position.state.value}</b> ({phase})",
         f"• Size: <b>{position.size_sol:.3f} SOL</b>",
         f"• Entry: {entry:.8f} SOL",
         f"• Last:  {last:.8f} SOL",
         f"• {pnl_emoji} <b>PnL: {pnl_str}</b>{_format_pnl_absolute(position.size_sol, pnl_pct, sol_price_eur)}",
         "",
-        f"📉 <b>Market Data</b>",
+        "📉 <b>Market Data</b>",
         f"• MCap: {mcap} | Liq: {liq}",
         f"• Vol 5m: {vol_5m} | Age: {age_min}m",
     ])
@@ -282,7 +442,7 @@ def build_trade_message(
     
     lines.extend([
         "",
-        f"⚡ <b>Momentum (5m)</b>",
+        "⚡ <b>Momentum (5m)</b>",
         f"• Price: {price_change_5m}",
         f"• Txns: 🟩 {buys_5m} / 🟥 {sells_5m}"
     ])
@@ -295,7 +455,7 @@ def build_trade_message(
         
         lines.extend([
             "",
-            f"🛡️ <b>Sicurezza</b>",
+            "🛡️ <b>Sicurezza</b>",
             f"• Risk Score: {risk_score}/100 {risk_emoji}",
             f"• Dev: {dev_holding} | Top10: {top10}"
         ])
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from datetime import datetime
 from typing import Iterable
 
 from solana_bot.config import Settings
 from solana_bot.core.coingecko_client import CoinGeckoClient
-from solana_bot.core.dexscreener_client import DexScreenerClient
+from solana_bot.core.dexscreener_client import DexScreenerClient, best_pair_by_liquidity
 from solana_bot.core.helius_webhook import HeliusWebhook
 from solana_bot.core.models import TokenInfo
 from solana_bot.core.pumpportal_client import PumpPortalClient
@@ -69,7 +70,7 @@ class TokenScanner:
 
         # Priority 2: Helius webhook (on-chain events)
         if self.webhook and self.settings.USE_HELIUS_WEBHOOK:
-            candidate_mints.update(await self.webhook.drain_mints())
+            candidate_mints.update(self.webhook.drain_mints())
 
         if self.settings.USE_DEXSCREENER_DISCOVERY:
             profiles = await self.dex_client.get_token_profiles()
@@ -166,6 +167,27 @@ class TokenScanner:
         if now - last_refresh < refresh_sec:
             return
         pairs = await self.dex_client.get_token_pairs(token.mint)
+        self._apply_pairs(token, pairs, now)
+
+    async def refresh_tokens_metrics(self, tokens: list[TokenInfo], now: float) -> None:
+        """Batched refresh_token_metrics: one DexScreener request per 30 due tokens."""
+        refresh_sec = self.settings.POSITION_METRICS_REFRESH_SEC
+        if refresh_sec <= 0:
+            return
+        due = [
+            token for token in tokens
+            if now - float(token.metadata.get("metrics_last_refresh_ts", 0.0)) >= refresh_sec
+        ]
+        if not due:
+            return
+        if len(due) == 1:
+            await self.refresh_token_metrics(due[0], now)
+            return
+        pairs_by_mint = await self.dex_client.get_pairs_for_tokens([token.mint for token in due])
+        for token in due:
+            self._apply_pairs(token, pairs_by_mint.get(token.mint), now)
+
+    def _apply_pairs(self, token: TokenInfo, pairs: list[dict] | None, now: float) -> None:
         if not pairs:
             return
         preferred_pair = token.metadata.get("pair_address")
@@ -176,7 +198,7 @@ class TokenScanner:
                     pair = candidate
                     break
         if pair is None:
-            pair = max(pairs, key=lambda p: (p.get("liquidity") or {}).get("usd", 0.0))
+            pair = best_pair_by_liquidity(pairs)
         updated = self._pair_to_token(pair, now)
         if updated.mint:
             token.age_sec = updated.age_sec
@@ -227,7 +249,7 @@ class TokenScanner:
             pairs = await self.dex_client.get_token_pairs(mint)
             if not pairs:
                 return None
-            pair = max(pairs, key=lambda p: (p.get("liquidity") or {}).get("usd", 0.0))
+            pair = best_pair_by_liquidity(pairs)
             token = self._pair_to_token(pair, now)
             if not token.mint:
                 return None
@@ -261,10 +283,9 @@ class TokenScanner:
         age_sec = 0
         if created_at_str:
             try:
-                from datetime import datetime
                 created_dt = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
                 age_sec = max(0, int(now - created_dt.timestamp()))
-            except Exception:
+            except ValueError:
                 pass
         
         price_usd = _safe_float(data.get("price_usd", 0))
@@ -543,15 +564,15 @@ class TokenScanner:
 
         # Note: We lowered the ratio check. Pump.fun curves often have Liq ~ 30-40% of Mcap at high vals.
         if liquidity_ratio < 0.10:
-             self.logger.info(f"💧 {token.symbol} REJECT: Liq/MCap Ratio Low ({liquidity_ratio:.2f} < 0.10)")
+             self.logger.info("💧 %s REJECT: Liq/MCap Ratio Low (%.2f < 0.10)", token.symbol, liquidity_ratio)
              return False
 
         # 2. Volume & Mcap (Must be "Graduate Material")
         if market_cap < self.settings.FINALSTRETCH_MIN_MCAP_USD:
             if self.settings.ALLOW_LOW_MCAP_IF_RUGCHECK_PASS:
-                self.logger.info(f"⚠️ {token.symbol} LOW_MCAP_BYPASS: (${market_cap:.0f}) - will check RugCheck")
+                self.logger.info("⚠️ %s LOW_MCAP_BYPASS: ($%.0f) - will check RugCheck", token.symbol, market_cap)
             else:
-                self.logger.info(f"🤏 {token.symbol} REJECT: Mcap Too Low (${market_cap:.0f} < ${self.settings.FINALSTRETCH_MIN_MCAP_USD:.0f})")
+                self.logger.info("🤏 %s REJECT: Mcap Too Low ($%.0f < $%.0f)", token.symbol, market_cap, self.settings.FINALSTRETCH_MIN_MCAP_USD)
                 return False
              
         if token.volume_usd < self.settings.FINALSTRETCH_MIN_VOLUME_USD:
@@ -559,7 +580,7 @@ class TokenScanner:
         
         # Age filter (max 30 min)
         if token.age_sec > self.settings.FINALSTRETCH_MAX_AGE_SEC:
-            self.logger.info(f"👴 {token.symbol} REJECT: Too Old ({token.age_sec}s > {self.settings.FINALSTRETCH_MAX_AGE_SEC}s)")
+            self.logger.info("👴 %s REJECT: Too Old (%ss > %ss)", token.symbol, token.age_sec, self.settings.FINALSTRETCH_MAX_AGE_SEC)
             return False
         
         # Bonding curve progress filter (min 35%)
@@ -567,17 +588,17 @@ class TokenScanner:
             if market_cap > 0:
                 estimated_bonding = min(100.0, (market_cap / 67000.0) * 100.0)
                 if estimated_bonding < self.settings.FINALSTRETCH_MIN_BONDING_PCT:
-                    self.logger.info(f"📉 {token.symbol} REJECT: Bonding Low (~{estimated_bonding:.0f}% < {self.settings.FINALSTRETCH_MIN_BONDING_PCT}%)")
+                    self.logger.info("📉 %s REJECT: Bonding Low (~%.0f%% < %s%%)", token.symbol, estimated_bonding, self.settings.FINALSTRETCH_MIN_BONDING_PCT)
                     return False
                 bonding_pct = estimated_bonding
             else:
                 phase_label = token.phase.value if hasattr(token.phase, "value") else str(token.phase)
-                self.logger.info(f"🚫 {token.symbol} REJECT: Not on Bonding Curve (Phase={phase_label})")
+                self.logger.info("🚫 %s REJECT: Not on Bonding Curve (Phase=%s)", token.symbol, phase_label)
                 return False
         
         # Volume filter (min $15k)
         if volume_h1 < self.settings.FINALSTRETCH_MIN_VOLUME_USD:
-             self.logger.info(f"🔇 {token.symbol} REJECT: Vol Low (${volume_h1:.0f} < ${self.settings.FINALSTRETCH_MIN_VOLUME_USD:.0f})")
+             self.logger.info("🔇 %s REJECT: Vol Low ($%.0f < $%.0f)", token.symbol, volume_h1, self.settings.FINALSTRETCH_MIN_VOLUME_USD)
              return False
         
         # Market cap filter (min $12k)
@@ -586,14 +607,14 @@ class TokenScanner:
                 # Allow and rely on RugCheck in bot.py
                 pass
             else:
-                self.logger.info(f"🤏 {token.symbol} REJECT: MCap Low (${market_cap:.0f} < ${self.settings.FINALSTRETCH_MIN_MCAP_USD:.0f})")
+                self.logger.info("🤏 %s REJECT: MCap Low ($%.0f < $%.0f)", token.symbol, market_cap, self.settings.FINALSTRETCH_MIN_MCAP_USD)
                 return False
 
         # Anti-Dump Filter: Reject tokens that crashed > 45% in the last hour.
         # Relaxed per user request to allow deep dips.
         change_h1 = token.metadata.get("price_change_h1", 0.0)
         if change_h1 < -45.0:
-            self.logger.info(f"📉 {token.symbol} REJECT: Heavy Dump ({change_h1:.1f}%)")
+            self.logger.info("📉 %s REJECT: Heavy Dump (%.1f%%)", token.symbol, change_h1)
             return False
 
         # Zombie/Roundtrip Filter:
@@ -605,7 +626,7 @@ class TokenScanner:
             # Only allow if it's currently rocketing (Breakout from zombie state)
             change_m5 = token.metadata.get("price_change_m5", 0.0)
             if change_m5 < 15.0:
-                self.logger.info(f"🧟 {token.symbol} REJECT: Zombie (Vol/Mcap={vol_mcap_ratio:.1f}, No Momentum)")
+                self.logger.info("🧟 %s REJECT: Zombie (Vol/Mcap=%.1f, No Momentum)", token.symbol, vol_mcap_ratio)
                 return False
         
         # Dev holding filter (max 5%)
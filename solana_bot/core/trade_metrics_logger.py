@@ -6,6 +6,11 @@ from typing import Any
 
 from solana_bot.config import Settings, get_settings
 
+try:
+    import supabase_sync
+except Exception:  # pragma: no cover - optional dependency
+    supabase_sync = None
+
 
 class TradeMetricsLogger:
     def __init__(self, settings: Settings) -> None:
@@ -19,8 +24,7 @@ class TradeMetricsLogger:
 
         # 2. Sync to Supabase
         try:
-            import supabase_sync
-            if supabase_sync.is_enabled():
+            if supabase_sync is not None and supabase_sync.is_enabled():
                 # Check if this qualifies as a trade event to sync
                 # Usually events have 'type' like 'BUY', 'SELL' or 'complete_trade'
                 evt_type = data.get("type", "").upper()
@@ -88,3 +88,10 @@ class Trader:
             return 0
         broker = self._get_live_broker()
         return await broker.get_token_balance(mint)
+
+    async def get_token_balances(self, mints: list[str]) -> dict[str, int]:
+        """Get current token balances for several mints in one RPC round-trip (live only)."""
+        if self.mode_manager.is_paper():
+            return {}
+        broker = self._get_live_broker()
+        return await broker.get_token_balances(mints)
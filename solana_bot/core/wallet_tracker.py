@@ -47,7 +47,7 @@ class LeaderWallet:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CopySignal:
     """Signal to copy a leader's trade."""
     
@@ -139,8 +139,7 @@ class WalletTracker:
     
     def remove_leader(self, address: str) -> bool:
         """Remove a leader wallet."""
-        if address in self._leaders:
-            del self._leaders[address]
+        if self._leaders.pop(address, None) is not None:
             self._save_leaders()
             self.logger.info("Removed leader: %s", address[:16])
             return True
@@ -179,12 +178,18 @@ class WalletTracker:
         last_seen = self._dedup_signatures.get(signature)
         if last_seen is not None and now - last_seen < self._dedup_ttl_sec:
             return True
+        # Re-insert so dict order stays oldest-first and pruning can stop early
+        self._dedup_signatures.pop(signature, None)
         self._dedup_signatures[signature] = now
         if len(self._dedup_signatures) > 1000:
             cutoff = now - self._dedup_ttl_sec
-            for sig, ts in list(self._dedup_signatures.items()):
-                if ts < cutoff:
-                    del self._dedup_signatures[sig]
+            expired: list[str] = []
+            for sig, ts in self._dedup_signatures.items():
+                if ts >= cutoff:
+                    break
+                expired.append(sig)
+            for sig in expired:
+                del self._dedup_signatures[sig]
         return False
     
     def process_transaction(
@@ -234,6 +239,9 @@ class WalletTracker:
             self.logger.debug("Not following sells for %s", leader.alias)
             return None
         
+        # Normalize once here so consumers can match positions with a plain dict lookup
+        token_mint = token_mint.strip()
+
         # Fallback for unknown symbol
         display_symbol = token_symbol
         if not display_symbol or display_symbol == "UNKNOWN":
@@ -279,7 +287,7 @@ class WalletTracker:
         except asyncio.QueueEmpty:
             return None
     
-    async def drain_signals(self) -> list[CopySignal]:
+    def drain_signals(self) -> list[CopySignal]:
         """Get all pending signals from queue."""
         signals: list[CopySignal] = []
         while True:
@@ -2,6 +2,7 @@ import asyncio
 
 from solana_bot.config import get_settings
 from solana_bot.core.bot import Bot
+from solana_bot.utils.event_loop import install_uvloop
 from solana_bot.utils.logging import setup_logging
 
 
@@ -13,6 +14,7 @@ async def async_main() -> None:
 
 
 def main() -> None:
+    install_uvloop()
     asyncio.run(async_main())
 
 
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+try:
+    import uvloop
+except Exception:  # pragma: no cover - optional dependency (not available on Windows)
+    uvloop = None
+
+
+def install_uvloop() -> bool:
+    """Use uvloop's libuv event loop when installed. Must run before asyncio.run()."""
+    if uvloop is None:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logging.getLogger("solana_bot").debug("uvloop event loop policy installed")
+    return True
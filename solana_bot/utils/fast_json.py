@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON with orjson when installed, falling back to the stdlib.
+
+    Both backends raise a ValueError subclass on malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Encode JSON as UTF-8 bytes with 2-space indentation, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
@@ -107,6 +107,32 @@ def safe_upsert(table: str, data: dict, conflict_columns: list = None) -> bool:
         return False
 
 
+def safe_upsert_many(table: str, rows: list, conflict_columns: list = None) -> bool:
+    """
+    Safely upsert several rows into a Supabase table in a single request.
+    Returns True if successful, False otherwise.
+    """
+    if not is_enabled() or not rows:
+        return False
+    
+    try:
+        user_id = get_user_id()
+        for row in rows:
+            if 'user_id' not in row:
+                row['user_id'] = user_id
+        
+        if conflict_columns:
+            supabase.table(table).upsert(rows, on_conflict=','.join(conflict_columns)).execute()
+        else:
+            supabase.table(table).upsert(rows).execute()
+        
+        logger.debug(f"✅ Upserted {len(rows)} rows into {table}")
+        return True
+    except Exception as e:
+        logger.error(f"❌ Failed to upsert {len(rows)} rows into {table}: {e}")
+        return False
+
+
 import time
 from datetime import datetime, timezone
 